@@ -17,7 +17,9 @@ from plotly.subplots import make_subplots
 import numpy as np
 from datetime import datetime, timedelta
 import re
+import os
 from collections import Counter
+from itertools import cycle, islice
 
 # McKinsey Color Palette
 MCKINSEY_COLORS = {
@@ -34,6 +36,14 @@ MCKINSEY_COLORS = {
     'light_gray': '#d3d3d3'    # Light Gray
 }
 
+# Chart colour order, cycled when a chart has more items than colours
+MCKINSEY_PALETTE = (
+    MCKINSEY_COLORS['primary'], MCKINSEY_COLORS['secondary'], MCKINSEY_COLORS['accent1'],
+    MCKINSEY_COLORS['accent2'], MCKINSEY_COLORS['accent3'], MCKINSEY_COLORS['accent4'],
+    MCKINSEY_COLORS['accent5'], MCKINSEY_COLORS['accent6'], MCKINSEY_COLORS['light_blue'],
+    MCKINSEY_COLORS['gray']
+)
+
 # Define consulting companies for filtering
 CONSULTING_COMPANIES = [
     'Accenture', 'Deloitte', 'PwC', 'KPMG', 'McKinsey', 'BCG', 'Bain',
@@ -44,6 +54,24 @@ CONSULTING_COMPANIES = [
     'Sopra Steria', 'T-Systems', 'Fujitsu', 'NEC', 'Unisys'
 ]
 
+# One alternation pattern so each supplier name is scanned once instead of once per company
+CONSULTING_PATTERN = re.compile('|'.join(re.escape(company) for company in CONSULTING_COMPANIES))
+
+# Patterns used while cleaning the raw scraper columns
+CONTRACT_VALUE_PATTERN = re.compile(r'(\d+\.?\d*)')
+CPV_CODE_PATTERN = re.compile(r'(\d+)')
+CPV_PREFIX_PATTERN = re.compile(r'^\d+\s*')
+
+# Scraper output and the preprocessed Parquet copy kept next to it
+DATA_PATH = '../data/multi_subsidiary_data.csv'
+CACHE_PATH = '../data/multi_subsidiary_data.parquet'
+
+# Scraper columns the dashboard works with, everything else is skipped while parsing
+DATA_COLUMNS = [
+    'subsidiary_name', 'Bezeichnung', 'Lieferant', 'Kategorie (CPV Hauptteil)',
+    'Bieter', 'Summe', 'Aktualisiert'
+]
+
 # Page configuration
 st.set_page_config(
     page_title="ÖBB Multi-Subsidiary Procurement Intelligence",
@@ -84,42 +112,65 @@ st.markdown(f"""
 </style>
 """, unsafe_allow_html=True)
 
-@st.cache_data
+def parse_contract_value(value):
+    """Turn a German formatted amount like '77.495,00' into a numeric string"""
+    if not isinstance(value, str):
+        return None
+    match = CONTRACT_VALUE_PATTERN.search(value.replace('.', '').replace(',', '.'))
+    return match.group(1) if match else None
+
+def split_cpv_category(category):
+    """Split a 'CPV code + description' entry into its code and description"""
+    if not isinstance(category, str):
+        return None, None
+    code = CPV_CODE_PATTERN.search(category)
+    return (code.group(1) if code else None), CPV_PREFIX_PATTERN.sub('', category, count=1)
+
+@st.cache_data(show_spinner=False)
 def load_data():
     """Load and preprocess the procurement data"""
     try:
-        df = pd.read_csv('../data/multi_subsidiary_data.csv')
+        # Reuse the preprocessed Parquet copy unless the CSV or this preprocessing code changed since
+        source_mtime = max(os.path.getmtime(DATA_PATH), os.path.getmtime(__file__))
+        if os.path.exists(CACHE_PATH) and os.path.getmtime(CACHE_PATH) >= source_mtime:
+            return pd.read_parquet(CACHE_PATH)
+        
+        df = pd.read_csv(DATA_PATH, usecols=lambda column: column in DATA_COLUMNS)
         
         # Clean and preprocess data
-        df['Aktualisiert'] = pd.to_datetime(df['Aktualisiert'], format='%d.%m.%Y', errors='coerce')
+        df['Aktualisiert'] = pd.to_datetime(df['Aktualisiert'], format='%d.%m.%Y', errors='coerce', cache=True)
+        
+        # Month bucket used by the monthly charts
+        df['YearMonth'] = df['Aktualisiert'].dt.to_period('M')
         
         # Clean contract values
-        df['Summe_Clean'] = df['Summe'].str.replace('.', '').str.replace(',', '.').str.extract(r'(\d+\.?\d*)')[0]
-        df['Summe_Clean'] = pd.to_numeric(df['Summe_Clean'], errors='coerce')
+        df['Summe_Clean'] = pd.to_numeric([parse_contract_value(value) for value in df['Summe']], errors='coerce')
         
         # Extract CPV category numbers
-        df['CPV_Code'] = df['Kategorie (CPV Hauptteil)'].str.extract(r'(\d+)')[0]
-        df['CPV_Category'] = df['Kategorie (CPV Hauptteil)'].str.replace(r'^\d+\s*', '', regex=True)
+        cpv_parts = [split_cpv_category(category) for category in df['Kategorie (CPV Hauptteil)']]
+        df['CPV_Code'] = [code for code, _ in cpv_parts]
+        df['CPV_Category'] = [category for _, category in cpv_parts]
         
         # Company cleaning
         df['Lieferant_Clean'] = df['Lieferant'].str.strip()
         
-        # Identify consulting companies
-        df['Is_Consulting'] = df['Lieferant_Clean'].apply(
-            lambda x: any(consulting in str(x) for consulting in CONSULTING_COMPANIES) if pd.notna(x) else False
-        )
+        # Identify consulting companies, matching each distinct supplier name only once
+        suppliers = df['Lieferant_Clean'].dropna().unique()
+        consulting_suppliers = [supplier for supplier in suppliers if CONSULTING_PATTERN.search(supplier)]
+        df['Is_Consulting'] = df['Lieferant_Clean'].isin(consulting_suppliers)
         
-        # Extract consulting companies found in data
-        consulting_matches = []
-        for company in df['Lieferant_Clean'].dropna():
-            for consulting in CONSULTING_COMPANIES:
-                if consulting.lower() in company.lower():
-                    consulting_matches.append(company)
-                    break
+        # Keep the supplier name for consulting companies only
+        df['Consulting_Company'] = df['Lieferant_Clean'].where(df['Is_Consulting'])
         
-        df['Consulting_Company'] = df['Lieferant_Clean'].apply(
-            lambda x: x if x in consulting_matches else None
-        )
+        # Repeating string columns as categories so groupbys and counts work on integer codes
+        for column in ['subsidiary_name', 'Lieferant_Clean', 'CPV_Category', 'CPV_Code', 'Consulting_Company']:
+            df[column] = df[column].astype('category')
+        
+        # The Parquet copy is only a speed-up, so a failed write shouldn't stop the dashboard
+        try:
+            df.to_parquet(CACHE_PATH, engine='pyarrow', compression='zstd')
+        except Exception:
+            pass
         
         return df
     except FileNotFoundError:
@@ -131,42 +182,171 @@ def load_data():
 
 def get_mckinsey_colors(n):
     """Get McKinsey color palette for n items"""
-    colors = [
-        MCKINSEY_COLORS['primary'], MCKINSEY_COLORS['secondary'], MCKINSEY_COLORS['accent1'],
-        MCKINSEY_COLORS['accent2'], MCKINSEY_COLORS['accent3'], MCKINSEY_COLORS['accent4'],
-        MCKINSEY_COLORS['accent5'], MCKINSEY_COLORS['accent6'], MCKINSEY_COLORS['light_blue'],
-        MCKINSEY_COLORS['gray']
-    ]
-    return colors[:n] if n <= len(colors) else colors * (n // len(colors) + 1)
+    return list(islice(cycle(MCKINSEY_PALETTE), n))
+
+def top_counts(series, n):
+    """Get the n most frequent values, skipping categories without any rows"""
+    counts = series.value_counts()
+    return counts[counts > 0].head(n)
+
+def top_values(df, column, n):
+    """Get the n groups of a column with the highest total contract value"""
+    return df.groupby(column, observed=True)['Summe_Clean'].sum().nlargest(n)
+
+@st.cache_data
+def supplier_options(suppliers):
+    """Sorted supplier names for the company selectors, cached per supplier column"""
+    return tuple(sorted(suppliers.dropna().unique().tolist()))
+
+@st.cache_resource
+def top_bar_chart(items, title, colors, height=None):
+    """Build a horizontal top-N bar chart from (label, value) pairs, reused across reruns"""
+    fig = px.bar(
+        x=[value for _, value in items],
+        y=[label for label, _ in items],
+        orientation='h',
+        title=title,
+        color_discrete_sequence=list(colors)
+    )
+    fig.update_layout(
+        height=height,
+        showlegend=False,
+        title_font_color=MCKINSEY_COLORS['primary']
+    )
+    return fig
+
+@st.cache_resource
+def share_pie_chart(items, title, colors, height=None):
+    """Build a market share pie chart from (label, value) pairs, reused across reruns"""
+    fig = px.pie(
+        values=[value for _, value in items],
+        names=[label for label, _ in items],
+        title=title,
+        color_discrete_sequence=list(colors)
+    )
+    fig.update_layout(
+        height=height,
+        title_font_color=MCKINSEY_COLORS['primary']
+    )
+    return fig
+
+def market_stats(df):
+    """Market-wide totals and averages shared by the metric cards"""
+    return {
+        'contracts': len(df),
+        'total_value': df['Summe_Clean'].sum(),
+        'avg_value': df['Summe_Clean'].mean(),
+        'avg_bidders': df['Bieter'].mean(),
+        'suppliers': df['Lieferant_Clean'].nunique()
+    }
+
+@st.cache_data
+def build_aggregates():
+    """Precompute the full-market aggregates behind the overview page once per data load"""
+    df = load_data()
+    consulting_df = df[df['Is_Consulting']]
+    return {
+        'market': market_stats(df),
+        'max_value': int(df['Summe_Clean'].max()),
+        'top_companies': top_counts(df['Lieferant_Clean'], 15),
+        'is_consulting': df.groupby('Lieferant_Clean', observed=True)['Is_Consulting'].first(),
+        'consulting_contracts': len(consulting_df),
+        'consulting_value': consulting_df['Summe_Clean'].sum(),
+        'consulting_avg_value': consulting_df['Summe_Clean'].mean(),
+        'consulting_suppliers': consulting_df['Lieferant_Clean'].nunique()
+    }
 
-def create_market_overview(df):
+# The page aggregates below are keyed on the sidebar filters; the filtered frames
+# are passed unhashed because the same filters always produce the same rows
+
+@st.cache_data
+def market_share_aggregates(_df, filters):
+    """Top supplier shares and market totals for the filtered data"""
+    return {
+        'top_by_count': top_counts(_df['Lieferant_Clean'], 12),
+        'top_by_value': top_values(_df, 'Lieferant_Clean', 12),
+        'contracts': len(_df),
+        'total_value': _df['Summe_Clean'].sum()
+    }
+
+@st.cache_data
+def category_aggregates(_df, _consulting_df, filters):
+    """Category rankings and the consulting split per category for the filtered data"""
+    top_categories = top_counts(_df['CPV_Category'], 6).index
+    return {
+        'top_by_count': top_counts(_df['CPV_Category'], 10),
+        'top_by_value': top_values(_df, 'CPV_Category', 10),
+        'consulting_top_by_count': top_counts(_consulting_df['CPV_Category'], 8),
+        # Count both groups for every category in one crosstab instead of filtering per category
+        'consulting_split': pd.crosstab(_df['CPV_Category'], _df['Is_Consulting']).reindex(
+            index=top_categories, columns=[True, False], fill_value=0
+        ),
+        'deep_dive_options': top_counts(_df['CPV_Category'], 20).index
+    }
+
+@st.cache_data
+def consulting_aggregates(_consulting_df, filters):
+    """Per-firm summary and category rankings for the filtered consulting contracts"""
+    consulting_summary = _consulting_df.groupby('Lieferant_Clean', observed=True).agg({
+        'Summe_Clean': ['count', 'sum', 'mean'],
+        'Bieter': 'mean'
+    }).round(2)
+    consulting_summary.columns = ['Contracts', 'Total Value (€)', 'Avg Value (€)', 'Avg Competition']
+    return {
+        'summary': consulting_summary.sort_values('Total Value (€)', ascending=False),
+        'top_categories_by_count': top_counts(_consulting_df['CPV_Category'], 10),
+        'top_categories_by_value': top_values(_consulting_df, 'CPV_Category', 10)
+    }
+
+@st.cache_data
+def monthly_trends(_df, filters, start_date, end_date):
+    """Monthly contract counts and values, overall and for consulting, within a date range"""
+    start_ts = pd.Timestamp(start_date)
+    end_ts = pd.Timestamp(end_date) + pd.Timedelta(days=1)
+    mask = (_df['Aktualisiert'] >= start_ts) & (_df['Aktualisiert'] < end_ts)
+    df_filtered = _df[mask]
+    
+    # Overall and consulting monthly trends in one grouped pass; masking the
+    # non-consulting values lets count/sum skip them for the consulting columns
+    # (YearMonth is precomputed in load_data)
+    monthly_values = pd.DataFrame({
+        'Total': df_filtered['Summe_Clean'],
+        'Consulting': df_filtered['Summe_Clean'].where(df_filtered['Is_Consulting'])
+    })
+    return monthly_values.groupby(df_filtered['YearMonth']).agg(
+        Total_Contracts=('Total', 'count'),
+        Total_Value=('Total', 'sum'),
+        Consulting_Contracts=('Consulting', 'count'),
+        Consulting_Value=('Consulting', 'sum')
+    )
+
+def create_market_overview(df, aggs):
     """Create balanced market overview with consulting insights"""
     if df.empty:
         return
     
     st.markdown('<div class="main-header">📊 ÖBB Procurement Market Intelligence</div>', unsafe_allow_html=True)
     
-    # Overall market metrics
-    consulting_df = df[df['Is_Consulting'] == True]
-    
     col1, col2, col3, col4 = st.columns(4)
     
+    stats = aggs['market']
+    
     with col1:
-        total_contracts = len(df)
+        total_contracts = stats['contracts']
         st.metric("Total Contracts", f"{total_contracts:,}")
     
     with col2:
-        total_value = df['Summe_Clean'].sum()
+        total_value = stats['total_value']
         st.metric("Total Market Value", f"€{total_value:,.0f}")
     
     with col3:
-        unique_suppliers = df['Lieferant_Clean'].nunique()
-        consulting_share = len(consulting_df) / len(df) * 100 if len(df) > 0 else 0
+        unique_suppliers = stats['suppliers']
+        consulting_share = aggs['consulting_contracts'] / total_contracts * 100 if total_contracts > 0 else 0
         st.metric("Total Suppliers", f"{unique_suppliers:,}", 
                  f"{consulting_share:.1f}% consulting")
     
     with col4:
-        avg_contract_value = df['Summe_Clean'].mean()
+        avg_contract_value = stats['avg_value']
         st.metric("Avg Contract Value", f"€{avg_contract_value:,.0f}")
     
     # Market composition analysis
@@ -176,33 +356,25 @@ def create_market_overview(df):
     
     with col1:
         # Top companies overall with consulting highlighted
-        top_companies = df['Lieferant_Clean'].value_counts().head(15)
+        top_companies = aggs['top_companies']
         
         # Create color map - consulting companies get McKinsey accent colors, others get gray
-        colors = []
-        for company in top_companies.index:
-            if df[df['Lieferant_Clean'] == company]['Is_Consulting'].iloc[0]:
-                colors.append(MCKINSEY_COLORS['accent4'])  # Consulting companies in red-pink
-            else:
-                colors.append(MCKINSEY_COLORS['light_gray'])  # Non-consulting in gray
-        
-        fig_companies = px.bar(
-            x=top_companies.values,
-            y=top_companies.index,
-            orientation='h',
-            title="Top 15 Companies by Contract Count (Consulting Highlighted)",
-            color_discrete_sequence=colors
-        )
-        fig_companies.update_layout(
-            showlegend=False,
-            height=500,
-            title_font_color=MCKINSEY_COLORS['primary']
+        colors = [
+            MCKINSEY_COLORS['accent4'] if aggs['is_consulting'][company] else MCKINSEY_COLORS['light_gray']
+            for company in top_companies.index
+        ]
+        
+        fig_companies = top_bar_chart(
+            tuple(top_companies.items()),
+            "Top 15 Companies by Contract Count (Consulting Highlighted)",
+            tuple(colors),
+            height=500
         )
         st.plotly_chart(fig_companies, use_container_width=True)
     
     with col2:
         # Market share by value with consulting split
-        consulting_value = consulting_df['Summe_Clean'].sum()
+        consulting_value = aggs['consulting_value']
         non_consulting_value = total_value - consulting_value
         
         split_data = pd.DataFrame({
@@ -224,17 +396,17 @@ def create_market_overview(df):
         st.plotly_chart(fig_split, use_container_width=True)
     
     # Key consulting insights box
-    if not consulting_df.empty:
+    if aggs['consulting_contracts'] > 0:
         st.markdown('<div class="section-header">🎯 Consulting Market Insights</div>', unsafe_allow_html=True)
         col1, col2, col3 = st.columns(3)
         
         with col1:
-            consulting_companies = consulting_df['Lieferant_Clean'].nunique()
+            consulting_companies = aggs['consulting_suppliers']
             st.metric("Consulting Firms Active", f"{consulting_companies}")
         
         with col2:
-            avg_consulting_value = consulting_df['Summe_Clean'].mean()
-            avg_overall_value = df['Summe_Clean'].mean()
+            avg_consulting_value = aggs['consulting_avg_value']
+            avg_overall_value = stats['avg_value']
             premium = ((avg_consulting_value/avg_overall_value - 1) * 100) if avg_overall_value > 0 else 0
             st.metric("Consulting Premium", f"{premium:+.1f}%", "vs market average")
         
@@ -247,7 +419,7 @@ def create_company_analysis(df):
     st.header("🏢 Company Analysis")
     
     # Company selection
-    companies = sorted(df['Lieferant_Clean'].dropna().unique())
+    companies = supplier_options(df['Lieferant_Clean'])
     selected_companies = st.multiselect(
         "Select companies to analyze:",
         companies,
@@ -262,12 +434,24 @@ def create_company_analysis(df):
     # Filter data for selected companies
     company_df = df[df['Lieferant_Clean'].isin(selected_companies)]
     
+    # One groupby pass feeds both charts and the summary table
+    company_summary = company_df.groupby('Lieferant_Clean', observed=True).agg(
+        Rows=('Summe_Clean', 'size'),
+        Contracts=('Summe_Clean', 'count'),
+        Total=('Summe_Clean', 'sum'),
+        Avg=('Summe_Clean', 'mean'),
+        Max=('Summe_Clean', 'max'),
+        AvgComp=('Bieter', 'mean'),
+        First=('Aktualisiert', 'min'),
+        Last=('Aktualisiert', 'max')
+    )
+    
     # Company metrics
     col1, col2 = st.columns(2)
     
     with col1:
         # Contract count by company
-        contract_counts = company_df.groupby('Lieferant_Clean').size().sort_values(ascending=False)
+        contract_counts = company_summary['Rows'].sort_values(ascending=False)
         fig_contracts = px.bar(
             x=contract_counts.values,
             y=contract_counts.index,
@@ -280,7 +464,7 @@ def create_company_analysis(df):
     
     with col2:
         # Total value by company
-        value_by_company = company_df.groupby('Lieferant_Clean')['Summe_Clean'].sum().sort_values(ascending=False)
+        value_by_company = company_summary['Total'].sort_values(ascending=False)
         fig_value = px.bar(
             x=value_by_company.values,
             y=value_by_company.index,
@@ -293,11 +477,7 @@ def create_company_analysis(df):
     
     # Detailed company table
     st.subheader("📋 Company Performance Summary")
-    company_summary = company_df.groupby('Lieferant_Clean').agg({
-        'Summe_Clean': ['count', 'sum', 'mean', 'max'],
-        'Bieter': 'mean',
-        'Aktualisiert': ['min', 'max']
-    }).round(2)
+    company_summary = company_summary.drop(columns='Rows').round(2)
     
     company_summary.columns = ['Contracts', 'Total Value (€)', 'Avg Value (€)', 'Max Value (€)', 
                              'Avg Competitors', 'First Contract', 'Last Contract']
@@ -305,56 +485,53 @@ def create_company_analysis(df):
     
     st.dataframe(company_summary, use_container_width=True)
 
-def create_market_share_analysis(df):
+def create_market_share_analysis(df, consulting_df, filters):
     """Create market share analysis with McKinsey colors and consulting highlights"""
     st.markdown('<div class="section-header">📈 Market Share Analysis</div>', unsafe_allow_html=True)
     
+    shares = market_share_aggregates(df, filters)
+    
     col1, col2 = st.columns(2)
     
     with col1:
         # Market share by contract count
-        top_companies_count = df['Lieferant_Clean'].value_counts().head(12)
+        top_companies_count = shares['top_by_count']
         colors = get_mckinsey_colors(len(top_companies_count))
         
-        fig_pie_count = px.pie(
-            values=top_companies_count.values,
-            names=top_companies_count.index,
-            title="Market Share by Contract Count (Top 12)",
-            color_discrete_sequence=colors
+        fig_pie_count = share_pie_chart(
+            tuple(top_companies_count.items()),
+            "Market Share by Contract Count (Top 12)",
+            tuple(colors)
         )
-        fig_pie_count.update_layout(title_font_color=MCKINSEY_COLORS['primary'])
         st.plotly_chart(fig_pie_count, use_container_width=True)
     
     with col2:
         # Market share by value
-        top_companies_value = df.groupby('Lieferant_Clean')['Summe_Clean'].sum().sort_values(ascending=False).head(12)
+        top_companies_value = shares['top_by_value']
         colors = get_mckinsey_colors(len(top_companies_value))
         
-        fig_pie_value = px.pie(
-            values=top_companies_value.values,
-            names=top_companies_value.index,
-            title="Market Share by Value (Top 12)",
-            color_discrete_sequence=colors
+        fig_pie_value = share_pie_chart(
+            tuple(top_companies_value.items()),
+            "Market Share by Value (Top 12)",
+            tuple(colors)
         )
-        fig_pie_value.update_layout(title_font_color=MCKINSEY_COLORS['primary'])
         st.plotly_chart(fig_pie_value, use_container_width=True)
     
     # Market concentration metrics
     st.markdown('<div class="section-header">🎯 Market Concentration</div>', unsafe_allow_html=True)
     col1, col2, col3 = st.columns(3)
     
-    total_contracts = len(df)
-    total_value = df['Summe_Clean'].sum()
-    consulting_df = df[df['Is_Consulting'] == True]
+    total_contracts = shares['contracts']
+    total_value = shares['total_value']
     
     with col1:
         # Top 5 companies concentration
-        top5_contracts = df['Lieferant_Clean'].value_counts().head(5).sum()
+        top5_contracts = top_companies_count.head(5).sum()
         concentration_contracts = (top5_contracts / total_contracts) * 100
         st.metric("Top 5 Companies", f"{concentration_contracts:.1f}%", "of contracts")
     
     with col2:
-        top5_value = df.groupby('Lieferant_Clean')['Summe_Clean'].sum().sort_values(ascending=False).head(5).sum()
+        top5_value = top_companies_value.head(5).sum()
         concentration_value = (top5_value / total_value) * 100
         st.metric("Top 5 Companies", f"{concentration_value:.1f}%", "of value")
     
@@ -366,90 +543,67 @@ def create_market_share_analysis(df):
         else:
             st.metric("Consulting Share", "0.0%", "of market")
 
-def create_category_analysis(df):
+def create_category_analysis(df, consulting_df, filters):
     """Create category analysis with consulting insights"""
     st.markdown('<div class="section-header">🏷️ Category Analysis</div>', unsafe_allow_html=True)
     
+    categories = category_aggregates(df, consulting_df, filters)
+    
     # Top categories with McKinsey colors
     col1, col2 = st.columns(2)
     
     with col1:
-        category_counts = df['CPV_Category'].value_counts().head(10)
+        category_counts = categories['top_by_count']
         colors = get_mckinsey_colors(len(category_counts))
         
-        fig_cat = px.bar(
-            x=category_counts.values,
-            y=category_counts.index,
-            orientation='h',
-            title="Top 10 Categories by Contract Count",
-            color_discrete_sequence=colors
-        )
-        fig_cat.update_layout(
-            height=500,
-            showlegend=False,
-            title_font_color=MCKINSEY_COLORS['primary']
+        fig_cat = top_bar_chart(
+            tuple(category_counts.items()),
+            "Top 10 Categories by Contract Count",
+            tuple(colors),
+            height=500
         )
         st.plotly_chart(fig_cat, use_container_width=True)
     
     with col2:
-        category_values = df.groupby('CPV_Category')['Summe_Clean'].sum().sort_values(ascending=False).head(10)
+        category_values = categories['top_by_value']
         colors = get_mckinsey_colors(len(category_values))
         
-        fig_cat_val = px.bar(
-            x=category_values.values,
-            y=category_values.index,
-            orientation='h',
-            title="Top 10 Categories by Value",
-            color_discrete_sequence=colors
-        )
-        fig_cat_val.update_layout(
-            height=500,
-            showlegend=False,
-            title_font_color=MCKINSEY_COLORS['primary']
+        fig_cat_val = top_bar_chart(
+            tuple(category_values.items()),
+            "Top 10 Categories by Value",
+            tuple(colors),
+            height=500
         )
         st.plotly_chart(fig_cat_val, use_container_width=True)
     
     # Consulting category analysis
-    consulting_df = df[df['Is_Consulting'] == True]
     if not consulting_df.empty:
         st.markdown('<div class="section-header">🎯 Consulting Category Breakdown</div>', unsafe_allow_html=True)
         
         col1, col2 = st.columns(2)
         
         with col1:
-            consulting_categories = consulting_df['CPV_Category'].value_counts().head(8)
+            consulting_categories = categories['consulting_top_by_count']
             colors = get_mckinsey_colors(len(consulting_categories))
             
-            fig_consulting_cat = px.bar(
-                x=consulting_categories.values,
-                y=consulting_categories.index,
-                orientation='h',
-                title="Top Categories for Consulting Firms",
-                color_discrete_sequence=colors
-            )
-            fig_consulting_cat.update_layout(
-                height=400,
-                showlegend=False,
-                title_font_color=MCKINSEY_COLORS['primary']
+            fig_consulting_cat = top_bar_chart(
+                tuple(consulting_categories.items()),
+                "Top Categories for Consulting Firms",
+                tuple(colors),
+                height=400
             )
             st.plotly_chart(fig_consulting_cat, use_container_width=True)
         
         with col2:
             # Consulting vs non-consulting by top categories
-            top_categories = df['CPV_Category'].value_counts().head(6).index
-            category_comparison = []
-            
-            for cat in top_categories:
-                cat_df = df[df['CPV_Category'] == cat]
-                consulting_count = len(cat_df[cat_df['Is_Consulting'] == True])
-                total_count = len(cat_df)
-                category_comparison.append({
-                    'Category': cat[:30] + '...' if len(cat) > 30 else cat,
-                    'Consulting': consulting_count,
-                    'Non-Consulting': total_count - consulting_count
-                })
+            category_split = categories['consulting_split']
+            top_categories = category_split.index
             
-            comparison_df = pd.DataFrame(category_comparison)
+            comparison_df = pd.DataFrame({
+                'Category': [cat[:30] + '...' if len(cat) > 30 else cat for cat in top_categories],
+                'Consulting': category_split[True].values,
+                'Non-Consulting': category_split[False].values
+            })
             
             fig_comparison = go.Figure()
             fig_comparison.add_trace(go.Bar(
@@ -477,12 +631,11 @@ def create_category_analysis(df):
     st.markdown('<div class="section-header">🔍 Category Deep Dive</div>', unsafe_allow_html=True)
     selected_category = st.selectbox(
         "Select a category to analyze:",
-        df['CPV_Category'].value_counts().index[:20]
+        categories['deep_dive_options']
     )
     
     if selected_category:
         category_df = df[df['CPV_Category'] == selected_category]
-        category_consulting = category_df[category_df['Is_Consulting'] == True]
         
         col1, col2, col3, col4 = st.columns(4)
         
@@ -491,31 +644,34 @@ def create_category_analysis(df):
         with col2:
             st.metric("Total Value", f"€{category_df['Summe_Clean'].sum():,.0f}")
         with col3:
-            consulting_in_cat = len(category_consulting)
+            consulting_in_cat = int(category_df['Is_Consulting'].sum())
             consulting_pct = (consulting_in_cat / len(category_df)) * 100 if len(category_df) > 0 else 0
             st.metric("Consulting Contracts", f"{consulting_in_cat}", f"{consulting_pct:.1f}%")
         with col4:
             st.metric("Unique Suppliers", category_df['Lieferant_Clean'].nunique())
         
         # Top performers in category with consulting highlight
-        category_leaders = category_df.groupby('Lieferant_Clean').agg({
+        category_leaders = category_df.groupby('Lieferant_Clean', observed=True).agg({
             'Summe_Clean': ['count', 'sum'],
             'Is_Consulting': 'first'
         }).round(2)
         category_leaders.columns = ['Contracts', 'Total Value', 'Is_Consulting']
-        category_leaders = category_leaders.sort_values('Total Value', ascending=False).head(10)
+        category_leaders = category_leaders.nlargest(10, 'Total Value')
         
         st.subheader(f"Top Performers in {selected_category}")
         
-        # Style the dataframe to highlight consulting companies
-        def highlight_consulting(row):
-            if row['Is_Consulting']:
-                return ['background-color: #f95d6a; color: white'] * len(row)
-            return [''] * len(row)
-        
-        styled_df = category_leaders.drop('Is_Consulting', axis=1).style.apply(
-            lambda row: highlight_consulting(category_leaders.loc[row.name]), axis=1
+        # Style the dataframe to highlight consulting companies with one precomputed style matrix
+        leaders_table = category_leaders.drop('Is_Consulting', axis=1)
+        row_styles = np.where(
+            category_leaders['Is_Consulting'].to_numpy(dtype=bool), 'background-color: #f95d6a; color: white', ''
+        )
+        cell_styles = pd.DataFrame(
+            np.repeat(row_styles[:, None], leaders_table.shape[1], axis=1),
+            index=leaders_table.index,
+            columns=leaders_table.columns
         )
+        
+        styled_df = leaders_table.style.apply(lambda _: cell_styles, axis=None)
         st.dataframe(styled_df, use_container_width=True)
         st.caption("🎯 Consulting companies highlighted in red")
 
@@ -526,7 +682,7 @@ def create_company_deep_dive(df):
     st.markdown('<div class="section-header">🔬 Company Deep Dive</div>', unsafe_allow_html=True)
     
     # Company selector
-    companies = sorted(df['Lieferant_Clean'].dropna().unique())
+    companies = supplier_options(df['Lieferant_Clean'])
     selected_company = st.selectbox("Select a company for detailed analysis:", companies)
     
     if not selected_company:
@@ -540,6 +696,7 @@ def create_company_deep_dive(df):
         st.markdown(f'<div class="consulting-highlight">🎯 {selected_company} - CONSULTING FIRM</div>', unsafe_allow_html=True)
         st.write("")
     
+    stats = market_stats(df)
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
@@ -549,23 +706,22 @@ def create_company_deep_dive(df):
         st.metric("Total Value", f"€{total_value:,.0f}")
     with col3:
         avg_value = company_data['Summe_Clean'].mean()
-        market_avg = df['Summe_Clean'].mean()
+        market_avg = stats['avg_value']
         premium = ((avg_value/market_avg - 1) * 100) if market_avg > 0 else 0
         st.metric("Average Value", f"€{avg_value:,.0f}", f"{premium:+.1f}% vs market")
     with col4:
-        market_share = (len(company_data) / len(df)) * 100
+        market_share = (len(company_data) / stats['contracts']) * 100
         st.metric("Market Share", f"{market_share:.1f}%")
     
     col1, col2 = st.columns(2)
     
     with col1:
         # Company performance over time
-        if not company_data[company_data['Aktualisiert'].notna()].empty:
-            company_time = company_data[company_data['Aktualisiert'].notna()].copy()
-            company_time.loc[:, 'YearMonth'] = company_time['Aktualisiert'].dt.to_period('M')
-            monthly_performance = company_time.groupby('YearMonth').agg({
-                'Summe_Clean': ['count', 'sum']
-            })
+        has_date = company_data['Aktualisiert'].notna()
+        if has_date.any():
+            # Group the values by the precomputed month directly instead of copying the company rows
+            months = company_data.loc[has_date, 'YearMonth']
+            monthly_performance = company_data.loc[has_date, 'Summe_Clean'].groupby(months).agg(['count', 'sum'])
             monthly_performance.columns = ['Contracts', 'Value']
             
             fig_performance = make_subplots(specs=[[{"secondary_y": True}]])
@@ -598,19 +754,13 @@ def create_company_deep_dive(df):
     
     with col2:
         # Company's categories
-        company_categories = company_data['CPV_Category'].value_counts().head(8)
+        company_categories = top_counts(company_data['CPV_Category'], 8)
         colors = get_mckinsey_colors(len(company_categories))
         
-        fig_cat = px.bar(
-            x=company_categories.values,
-            y=company_categories.index,
-            orientation='h',
-            title=f"{selected_company} - Top Categories",
-            color_discrete_sequence=colors
-        )
-        fig_cat.update_layout(
-            showlegend=False,
-            title_font_color=MCKINSEY_COLORS['primary']
+        fig_cat = top_bar_chart(
+            tuple(company_categories.items()),
+            f"{selected_company} - Top Categories",
+            tuple(colors)
         )
         st.plotly_chart(fig_cat, use_container_width=True)
     
@@ -620,7 +770,7 @@ def create_company_deep_dive(df):
     
     with col1:
         avg_competition = company_data['Bieter'].mean()
-        market_avg_competition = df['Bieter'].mean()
+        market_avg_competition = stats['avg_bidders']
         st.metric("Avg Competition Faced", f"{avg_competition:.1f}", 
                  f"{avg_competition - market_avg_competition:+.1f} vs market")
     
@@ -637,12 +787,10 @@ def create_company_deep_dive(df):
     ]
     st.dataframe(recent_contracts, use_container_width=True)
 
-def create_consulting_competitive_analysis(df):
+def create_consulting_competitive_analysis(consulting_df, filters):
     """Create consulting-specific competitive analysis"""
     st.markdown('<div class="section-header">🎯 Consulting Competitive Landscape</div>', unsafe_allow_html=True)
     
-    consulting_df = df[df['Is_Consulting'] == True]
-    
     if consulting_df.empty:
         st.warning("No consulting companies found in the data.")
         return
@@ -651,29 +799,17 @@ def create_consulting_competitive_analysis(df):
     
     with col1:
         # Contract value distribution for consulting firms
-        consulting_summary = consulting_df.groupby('Lieferant_Clean').agg({
-            'Summe_Clean': ['count', 'sum', 'mean'],
-            'Bieter': 'mean'
-        }).round(2)
-        
-        consulting_summary.columns = ['Contracts', 'Total Value (€)', 'Avg Value (€)', 'Avg Competition']
-        consulting_summary = consulting_summary.sort_values('Total Value (€)', ascending=False)
+        consulting_summary = consulting_aggregates(consulting_df, filters)['summary']
         
         # Value by company chart
         top_consulting_value = consulting_summary.head(10)['Total Value (€)']
         colors = get_mckinsey_colors(len(top_consulting_value))
         
-        fig_value = px.bar(
-            x=top_consulting_value.values,
-            y=top_consulting_value.index,
-            orientation='h',
-            title="Total Contract Value by Consulting Firm",
-            color_discrete_sequence=colors
-        )
-        fig_value.update_layout(
-            showlegend=False,
-            height=500,
-            title_font_color=MCKINSEY_COLORS['primary']
+        fig_value = top_bar_chart(
+            tuple(top_consulting_value.items()),
+            "Total Contract Value by Consulting Firm",
+            tuple(colors),
+            height=500
         )
         st.plotly_chart(fig_value, use_container_width=True)
     
@@ -698,62 +834,52 @@ def create_consulting_competitive_analysis(df):
     st.subheader("📋 Consulting Firm Performance")
     st.dataframe(consulting_summary, use_container_width=True)
 
-def create_consulting_categories(df):
+def create_consulting_categories(consulting_df, filters):
     """Create consulting category analysis"""
     st.markdown('<div class="section-header">📊 Consulting Service Categories</div>', unsafe_allow_html=True)
     
-    consulting_df = df[df['Is_Consulting'] == True]
-    
     if consulting_df.empty:
         st.warning("No consulting companies found in the data.")
         return
     
     # Top categories for consulting
-    consulting_categories = consulting_df['CPV_Category'].value_counts().head(10)
+    consulting = consulting_aggregates(consulting_df, filters)
+    consulting_categories = consulting['top_categories_by_count']
     
     col1, col2 = st.columns(2)
     
     with col1:
         colors = get_mckinsey_colors(len(consulting_categories))
-        fig_cat = px.bar(
-            x=consulting_categories.values,
-            y=consulting_categories.index,
-            orientation='h',
-            title="Top Service Categories for Consulting",
-            color_discrete_sequence=colors
-        )
-        fig_cat.update_layout(
-            showlegend=False,
-            height=500,
-            title_font_color=MCKINSEY_COLORS['primary']
+        fig_cat = top_bar_chart(
+            tuple(consulting_categories.items()),
+            "Top Service Categories for Consulting",
+            tuple(colors),
+            height=500
         )
         st.plotly_chart(fig_cat, use_container_width=True)
     
     with col2:
         # Category value analysis
-        category_values = consulting_df.groupby('CPV_Category')['Summe_Clean'].sum().sort_values(ascending=False).head(10)
+        category_values = consulting['top_categories_by_value']
         colors = get_mckinsey_colors(len(category_values))
         
-        fig_cat_val = px.bar(
-            x=category_values.values,
-            y=category_values.index,
-            orientation='h',
-            title="Highest Value Categories for Consulting",
-            color_discrete_sequence=colors
-        )
-        fig_cat_val.update_layout(
-            showlegend=False,
-            height=500,
-            title_font_color=MCKINSEY_COLORS['primary']
+        fig_cat_val = top_bar_chart(
+            tuple(category_values.items()),
+            "Highest Value Categories for Consulting",
+            tuple(colors),
+            height=500
         )
         st.plotly_chart(fig_cat_val, use_container_width=True)
 
-def create_timeline_analysis(df):
+@st.fragment
+def create_timeline_analysis(df, filters):
     """Create timeline analysis with consulting overlay"""
     st.markdown('<div class="section-header">📅 Market Timeline Analysis</div>', unsafe_allow_html=True)
     
-    # Filter out invalid dates
-    df_time = df[df['Aktualisiert'].notna()].copy()
+    # Filter out invalid dates, copying only the columns the monthly trends read
+    df_time = df.loc[
+        df['Aktualisiert'].notna(), ['Aktualisiert', 'YearMonth', 'Summe_Clean', 'Is_Consulting']
+    ].copy()
     
     if df_time.empty:
         st.warning("No valid date data available for timeline analysis.")
@@ -769,75 +895,64 @@ def create_timeline_analysis(df):
     with col2:
         end_date = st.date_input("End Date", max_date)
     
-    # Filter by date range
-    mask = (df_time['Aktualisiert'].dt.date >= start_date) & (df_time['Aktualisiert'].dt.date <= end_date)
-    df_filtered = df_time[mask]
+    # Monthly trends with consulting overlay for the selected date range
+    monthly_combined = monthly_trends(df_time, filters, start_date, end_date)
     
-    if df_filtered.empty:
+    if monthly_combined.empty:
         st.warning("No data available for the selected date range.")
         return
     
-    # Monthly trends with consulting overlay
-    df_filtered.loc[:, 'YearMonth'] = df_filtered['Aktualisiert'].dt.to_period('M')
-    
-    # Overall monthly trends
-    monthly_all = df_filtered.groupby('YearMonth').agg({
-        'Summe_Clean': ['count', 'sum']
-    })
-    monthly_all.columns = ['Total_Contracts', 'Total_Value']
-    
-    # Consulting monthly trends
-    consulting_monthly = df_filtered[df_filtered['Is_Consulting'] == True].groupby('YearMonth').agg({
-        'Summe_Clean': ['count', 'sum']
-    })
-    consulting_monthly.columns = ['Consulting_Contracts', 'Consulting_Value']
-    
-    # Combine data
-    monthly_combined = monthly_all.join(consulting_monthly, how='left').fillna(0)
+    months = monthly_combined.index.astype(str)
     
     col1, col2 = st.columns(2)
     
     with col1:
-        # Contract count trends
-        fig_contracts = go.Figure()
-        fig_contracts.add_trace(go.Scatter(
-            x=monthly_combined.index.astype(str),
-            y=monthly_combined['Total_Contracts'],
-            name='Total Market',
-            line=dict(color=MCKINSEY_COLORS['primary'], width=3)
-        ))
-        fig_contracts.add_trace(go.Scatter(
-            x=monthly_combined.index.astype(str),
-            y=monthly_combined['Consulting_Contracts'],
-            name='Consulting',
-            line=dict(color=MCKINSEY_COLORS['accent4'], width=2)
-        ))
-        fig_contracts.update_layout(
-            title="Monthly Contract Trends",
-            title_font_color=MCKINSEY_COLORS['primary'],
-            height=400
+        # Contract count trends, built with all traces and the layout in one constructor call
+        fig_contracts = go.Figure(
+            data=[
+                go.Scatter(
+                    x=months,
+                    y=monthly_combined['Total_Contracts'],
+                    name='Total Market',
+                    line=dict(color=MCKINSEY_COLORS['primary'], width=3)
+                ),
+                go.Scatter(
+                    x=months,
+                    y=monthly_combined['Consulting_Contracts'],
+                    name='Consulting',
+                    line=dict(color=MCKINSEY_COLORS['accent4'], width=2)
+                )
+            ],
+            layout=dict(
+                title="Monthly Contract Trends",
+                title_font_color=MCKINSEY_COLORS['primary'],
+                height=400
+            )
         )
         st.plotly_chart(fig_contracts, use_container_width=True)
     
     with col2:
         # Value trends
-        fig_values = go.Figure()
-        fig_values.add_trace(go.Scatter(
-            x=monthly_combined.index.astype(str),
-            y=monthly_combined['Total_Value'],
-            name='Total Market',
-            line=dict(color=MCKINSEY_COLORS['primary'], width=3)
-        ))
-        fig_values.add_trace(go.Scatter(
-            x=monthly_combined.index.astype(str),
-            y=monthly_combined['Consulting_Value'],
-            name='Consulting',
-            line=dict(color=MCKINSEY_COLORS['accent4'], width=2)
-        ))
-        fig_values.update_layout(
-            title="Monthly Value Trends",
-            title_font_color=MCKINSEY_COLORS['primary'],
-            height=400
+        fig_values = go.Figure(
+            data=[
+                go.Scatter(
+                    x=months,
+                    y=monthly_combined['Total_Value'],
+                    name='Total Market',
+                    line=dict(color=MCKINSEY_COLORS['primary'], width=3)
+                ),
+                go.Scatter(
+                    x=months,
+                    y=monthly_combined['Consulting_Value'],
+                    name='Consulting',
+                    line=dict(color=MCKINSEY_COLORS['accent4'], width=2)
+                )
+            ],
+            layout=dict(
+                title="Monthly Value Trends",
+                title_font_color=MCKINSEY_COLORS['primary'],
+                height=400
+            )
         )
         st.plotly_chart(fig_values, use_container_width=True)
 
@@ -849,6 +964,9 @@ def main():
     if df.empty:
         st.stop()
     
+    # Full-dataset aggregates for the overview, slider bounds and sidebar footer
+    aggs = build_aggregates()
+    
     # Sidebar navigation - balanced approach
     st.sidebar.title("📊 Market Intelligence")
     page = st.sidebar.selectbox(
@@ -877,45 +995,48 @@ def main():
     min_value, max_value = st.sidebar.slider(
         "Contract Value Range (€)",
         min_value=0,
-        max_value=int(df['Summe_Clean'].max()),
-        value=(0, int(df['Summe_Clean'].max())),
+        max_value=aggs['max_value'],
+        value=(0, aggs['max_value']),
         step=1000
     )
     
-    # Apply filters
-    df_filtered = df[
-        (df['Summe_Clean'] >= min_value) & 
-        (df['Summe_Clean'] <= max_value)
-    ]
+    # Apply filters (rows without a parsed value drop out even at the full range)
+    df_filtered = df[df['Summe_Clean'].between(min_value, max_value)]
     
     if company_filter == "Consulting Only":
-        df_filtered = df_filtered[df_filtered['Is_Consulting'] == True]
+        df_filtered = df_filtered[df_filtered['Is_Consulting']]
     elif company_filter == "Non-Consulting Only":
-        df_filtered = df_filtered[df_filtered['Is_Consulting'] == False]
+        df_filtered = df_filtered[~df_filtered['Is_Consulting']]
+    
+    # Consulting subset of the filtered data, built once and shared by the pages that need it
+    consulting_df = df_filtered[df_filtered['Is_Consulting']]
+    
+    # Cache key for the per-page aggregates of this filter selection
+    filters = (company_filter, min_value, max_value)
     
     # Display selected page
     if page == "Market Overview":
-        create_market_overview(df)  # Always use full dataset for overview
+        create_market_overview(df, aggs)  # Always use full dataset for overview
     elif page == "Market Share Analysis":
-        create_market_share_analysis(df_filtered)
+        create_market_share_analysis(df_filtered, consulting_df, filters)
     elif page == "Competitive Intelligence":
-        create_consulting_competitive_analysis(df_filtered)
+        create_consulting_competitive_analysis(consulting_df, filters)
     elif page == "Category Analysis":
-        create_category_analysis(df_filtered)
+        create_category_analysis(df_filtered, consulting_df, filters)
     elif page == "Timeline Analysis":
-        create_timeline_analysis(df_filtered)
+        create_timeline_analysis(df_filtered, filters)
     elif page == "Company Deep Dive":
         create_company_deep_dive(df_filtered)
     
     # Footer with balanced stats
     st.sidebar.markdown("---")
     st.sidebar.markdown("📊 **Market Intelligence**")
-    consulting_count = len(df[df['Is_Consulting'] == True])
-    total_count = len(df)
+    consulting_count = aggs['consulting_contracts']
+    total_count = aggs['market']['contracts']
     st.sidebar.markdown(f"Total contracts: {total_count:,}")
     st.sidebar.markdown(f"Consulting: {consulting_count:,} ({consulting_count/total_count*100:.1f}%)")
     st.sidebar.markdown(f"Non-consulting: {total_count-consulting_count:,}")
-    st.sidebar.markdown(f"Total suppliers: {df['Lieferant_Clean'].nunique():,}")
+    st.sidebar.markdown(f"Total suppliers: {aggs['market']['suppliers']:,}")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -4,148 +4,152 @@ Final Multi-Subsidiary Web Scraper for OffeneVergaben.at
 Simplified and clean implementation
 
 Requirements:
-pip install selenium beautifulsoup4 pandas webdriver-manager
+pip install requests lxml selenium pandas webdriver-manager
 """
 
 import time
 import csv
 import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+import requests
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from webdriver_manager.chrome import ChromeDriverManager
-from bs4 import BeautifulSoup
+import lxml.html
+from lxml import etree
 import logging
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Page number in pagination links like "?page=12"
+PAGE_PARAM_PATTERN = re.compile(r'[?&]page=(\d+)')
+
+# Table and pagination XPaths, compiled once instead of being re-parsed for every page and row
+ROW_XPATH = etree.XPath('.//tr')
+CELL_XPATH = etree.XPath('.//td | .//th')
+PAGINATION_HREF_XPATH = etree.XPath('//*[contains(@class, "pagination")]//a/@href')
+
 class MultiSubsidiaryScraperConfig:
     """Configuration class for multi-subsidiary scraper"""
 
+    # Listing page of a contracting authority, filled in with the subsidiary id
+    BASE_URL = "https://offenevergaben.at/auftraggeber/{}"
+
     # Complete ÖBB Subsidiaries Configuration (22 subsidiaries total)
     SUBSIDIARIES = {
         "obb_business": {
             "name": "ÖBB-Business Competence Center",
-            "id": "8550",
-            "url": "https://offenevergaben.at/auftraggeber/8550"
+            "id": "8550"
         },
         "obb_infrastruktur": {
             "name": "ÖBB-Infrastruktur AG",
-            "id": "8538",
-            "url": "https://offenevergaben.at/auftraggeber/8538"
+            "id": "8538"
         },
         "obb_technische_services": {
             "name": "ÖBB-Technische Services Gesellschaft",
-            "id": "11068",
-            "url": "https://offenevergaben.at/auftraggeber/11068"
+            "id": "11068"
         },
         "obb_holding_all": {
             "name": "ÖBB Holding AG mit allen verbundenen Unternehmen",
-            "id": "11074",
-            "url": "https://offenevergaben.at/auftraggeber/11074"
+            "id": "11074"
         },
         "obb_personenverkehr": {
             "name": "ÖBB-Personenverkehr AG",
-            "id": "8547",
-            "url": "https://offenevergaben.at/auftraggeber/8547"
+            "id": "8547"
         },
         "obb_produktion": {
             "name": "ÖBB-Produktion",
-            "id": "8545",
-            "url": "https://offenevergaben.at/auftraggeber/8545"
+            "id": "8545"
         },
         "obb_postbus": {
             "name": "ÖBB-Postbus",
-            "id": "8581",
-            "url": "https://offenevergaben.at/auftraggeber/8581"
+            "id": "8581"
         },
         "obb_holding": {
             "name": "ÖBB-Holding AG",
-            "id": "11217",
-            "url": "https://offenevergaben.at/auftraggeber/11217"
+            "id": "11217"
         },
         "obb_immobilienmanagement": {
             "name": "ÖBB-Immobilienmanagement",
-            "id": "11090",
-            "url": "https://offenevergaben.at/auftraggeber/11090"
+            "id": "11090"
         },
         "obb_werbung": {
             "name": "ÖBB-Werbung",
-            "id": "11224",
-            "url": "https://offenevergaben.at/auftraggeber/11224"
+            "id": "11224"
         },
         "obb_rail_tours": {
             "name": "ÖBB Rail Tours Austria",
-            "id": "11446",
-            "url": "https://offenevergaben.at/auftraggeber/11446"
+            "id": "11446"
         },
         "obb_infrastruktur_ag": {
             "name": "ÖBB-Infrastruktur Aktiengesellschaft",
-            "id": "28842",
-            "url": "https://offenevergaben.at/auftraggeber/28842"
+            "id": "28842"
         },
         "obb_infrastruktur_gb_projekt": {
             "name": "ÖBB-Infrastruktur AG GB Projekt",
-            "id": "24814",
-            "url": "https://offenevergaben.at/auftraggeber/24814"
+            "id": "24814"
         },
         "obb_infrastruktur_2": {
             "name": "ÖBB Infrastruktur AG (2)",
-            "id": "36280",
-            "url": "https://offenevergaben.at/auftraggeber/36280"
+            "id": "36280"
         },
         "obb_personenverkehr_2": {
             "name": "ÖBB Personenverkehr AG (2)",
-            "id": "19826",
-            "url": "https://offenevergaben.at/auftraggeber/19826"
+            "id": "19826"
         },
         "obb_immobilienmanagement_2": {
             "name": "ÖBB-Immobilienmanagement (2)",
-            "id": "33422",
-            "url": "https://offenevergaben.at/auftraggeber/33422"
+            "id": "33422"
         },
         "obb_technische_services_2": {
             "name": "ÖBB-Technische Services-Gesellschaft (2)",
-            "id": "37657",
-            "url": "https://offenevergaben.at/auftraggeber/37657"
+            "id": "37657"
         },
         "obb_personenverkehr_3": {
             "name": "ÖBB-Personenverkehr AG (3)",
-            "id": "24566",
-            "url": "https://offenevergaben.at/auftraggeber/24566"
+            "id": "24566"
         },
         "obb_personenverkehr_4": {
             "name": "ÖBB Personenverkehr AG (4)",
-            "id": "29519",
-            "url": "https://offenevergaben.at/auftraggeber/29519"
+            "id": "29519"
         },
         "obb_personenverkehr_5": {
             "name": "ÖBB Personenverkehr AG (5)",
-            "id": "28047",
-            "url": "https://offenevergaben.at/auftraggeber/28047"
+            "id": "28047"
         },
         "obb_business_2": {
             "name": "ÖBB-Business Competence Center (2)",
-            "id": "37203",
-            "url": "https://offenevergaben.at/auftraggeber/37203"
+            "id": "37203"
         },
         "obb_business_3": {
             "name": "ÖBB-Business Competence Center (3)",
-            "id": "37202",
-            "url": "https://offenevergaben.at/auftraggeber/37202"
+            "id": "37202"
         }
     }
 
     # Configuration
-    BATCH_SIZE = 1000  # Write data every 1000 rows
+    WRITE_BUFFER_SIZE = 1 << 20  # Output file buffer, rows are written as each page is parsed
     OUTPUT_DIR = "../data"
+    REQUEST_TIMEOUT = 10  # Seconds per HTTP page request
+    MAX_WORKERS = 4  # Subsidiaries scraped in parallel, kept low to stay polite
+    PAGE_WORKERS = 3  # Pages of one subsidiary fetched in parallel once the page count is known
+    MAX_RETRIES = 5  # Attempts after a rate limit, server error or dropped connection
+    BACKOFF_BASE = 1  # Seconds before the first retry, doubled on every further attempt
+    BACKOFF_MAX = 30  # Upper bound for a single backoff wait
+    RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+    CHROMEDRIVER_PATH = os.environ.get("CHROMEDRIVER_PATH")  # Pinned driver binary, skips webdriver-manager
+    USER_AGENT = ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+                  "(KHTML, like Gecko) Chrome/126.0 Safari/537.36")
 
 class FinalMultiSubsidiaryScraper:
     """Final simplified multi-subsidiary scraper"""
@@ -153,6 +157,13 @@ class FinalMultiSubsidiaryScraper:
     def __init__(self):
         self.config = MultiSubsidiaryScraperConfig()
         self.driver = None
+        self.driver_lock = threading.Lock()  # One Chrome instance shared by all workers
+        self.driver_path = None  # Resolved once, a restarted driver reuses it
+        self.local = threading.local()  # Per-thread HTTP session and last parsed page
+        self.sessions = []
+        self.sessions_lock = threading.Lock()
+        self.first_pages = {}  # Subsidiary name -> first-page fingerprint, None once it turned out to have none
+        self.first_pages_ready = threading.Condition()
         self.ensure_output_dir()
 
     def ensure_output_dir(self):
@@ -166,27 +177,120 @@ class FinalMultiSubsidiaryScraper:
         chrome_options.add_argument("--disable-dev-shm-usage")
         chrome_options.add_argument("--headless")
 
-        service = Service(ChromeDriverManager().install())
+        # Only the table HTML is needed, so skip images, stylesheets and fonts
+        # and return from driver.get() once the DOM is parsed
+        chrome_options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.managed_default_content_settings.stylesheets": 2,
+            "profile.managed_default_content_settings.fonts": 2
+        })
+        chrome_options.page_load_strategy = 'eager'
+
+        # Prefer a pinned chromedriver over webdriver-manager's version lookup and download
+        if not self.driver_path:
+            self.driver_path = self.config.CHROMEDRIVER_PATH
+            if not self.driver_path or not os.path.isfile(self.driver_path):
+                self.driver_path = ChromeDriverManager().install()
+
+        service = Service(self.driver_path)
         self.driver = webdriver.Chrome(service=service, options=chrome_options)
         logger.info("Chrome WebDriver initialized")
 
-    def validate_page_content(self, page_url):
+    def get_session(self):
+        """Get the calling thread's HTTP session, creating it on first use"""
+        session = getattr(self.local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            session.headers.update({'User-Agent': self.config.USER_AGENT})
+            self.local.session = session
+            with self.sessions_lock:
+                self.sessions.append(session)
+        return session
+
+    def http_get(self, page_url):
+        """GET a page, backing off exponentially only when the server pushes back"""
+        for attempt in range(self.config.MAX_RETRIES + 1):
+            delay = min(self.config.BACKOFF_MAX, self.config.BACKOFF_BASE * 2 ** attempt)
+            try:
+                response = self.get_session().get(page_url, timeout=self.config.REQUEST_TIMEOUT)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if attempt == self.config.MAX_RETRIES:
+                    raise
+                logger.warning(f"{type(e).__name__} for {page_url}, retrying in {delay}s")
+                time.sleep(delay)
+                continue
+
+            if response.status_code in self.config.RETRY_STATUS_CODES and attempt < self.config.MAX_RETRIES:
+                # Honour the server's Retry-After hint when it gives one in seconds
+                retry_after = response.headers.get('Retry-After', '')
+                if retry_after.isdigit():
+                    delay = min(self.config.BACKOFF_MAX, int(retry_after))
+                logger.warning(f"HTTP {response.status_code} for {page_url}, retrying in {delay}s")
+                time.sleep(delay)
+                continue
+
+            response.raise_for_status()
+            return response
+
+    def fetch_page_source(self, page_url, use_browser=False):
+        """Fetch page HTML over plain HTTP, or through Chrome for a listing whose table isn't server-rendered"""
+        if not use_browser:
+            return self.http_get(page_url).text
+
+        with self.driver_lock:
+            for attempt in range(2):
+                if not self.driver:
+                    self.setup_driver()
+
+                try:
+                    self.driver.get(page_url)
+                    WebDriverWait(self.driver, 10).until(
+                        EC.presence_of_element_located((By.TAG_NAME, "table"))
+                    )
+                    return self.driver.page_source
+                except TimeoutException:
+                    raise
+                except WebDriverException as e:
+                    # The one long-lived driver is only restarted when its Chrome session is gone
+                    if attempt:
+                        raise
+                    logger.warning(f"Chrome session lost ({type(e).__name__}), restarting the driver")
+                    self.quit_driver()
+
+    def close(self):
+        """Release the HTTP sessions and the browser if one was started"""
+        for session in self.sessions:
+            session.close()
+        self.sessions = []
+        self.quit_driver()
+
+    def quit_driver(self):
+        """Shut down the browser if one was started, ignoring an already dead session"""
+        if self.driver:
+            try:
+                self.driver.quit()
+            except WebDriverException:
+                pass
+            self.driver = None
+
+    @staticmethod
+    def cell_text(cell):
+        """Text of a table cell with each text piece stripped, like BeautifulSoup's get_text(strip=True)"""
+        return ''.join(text.strip() for text in cell.itertext())
+
+    def validate_page_content(self, page_url, use_browser=False):
         """Validate if page has content - adapted from your function"""
+        self.local.page_tree = None
         try:
-            self.driver.get(page_url)
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.TAG_NAME, "table"))
-            )
-            time.sleep(1)
-
-            soup = BeautifulSoup(self.driver.page_source, 'html.parser')
-            tbody = soup.find('tbody')
+            # Parse once with lxml's C parser; extract_page_data reuses the tree
+            self.local.page_tree = lxml.html.document_fromstring(self.fetch_page_source(page_url, use_browser))
+            tbody = self.local.page_tree.find('.//tbody')
 
             # Check if tbody is empty
-            if not tbody or len(tbody.find_all('tr')) == 0:
+            rows = ROW_XPATH(tbody) if tbody is not None else []
+            if not rows:
                 return False, 0
 
-            rows = tbody.find_all('tr')
             return True, len(rows)
 
         except Exception as e:
@@ -194,32 +298,29 @@ class FinalMultiSubsidiaryScraper:
             return False, 0
 
     def extract_page_data(self):
-        """Extract data from current page"""
+        """Extract data from the page last fetched by validate_page_content"""
         try:
-            soup = BeautifulSoup(self.driver.page_source, 'html.parser')
-            table = soup.find('table')
+            table = self.local.page_tree.find('.//table')
 
-            if not table:
+            if table is None:
                 return [], []
 
             # Extract headers
             headers = []
-            thead = table.find('thead')
-            if thead:
-                header_row = thead.find('tr')
-                if header_row:
-                    headers = [th.get_text(strip=True) for th in header_row.find_all(['th', 'td'])]
+            header_row = table.find('.//thead//tr')
+            if header_row is not None:
+                headers = [self.cell_text(th) for th in CELL_XPATH(header_row)]
 
             # Extract data rows
-            tbody = table.find('tbody')
-            if not tbody:
+            tbody = table.find('.//tbody')
+            if tbody is None:
                 return headers, []
 
             page_data = []
-            for row in tbody.find_all('tr'):
-                cells = row.find_all(['td', 'th'])
+            for row in ROW_XPATH(tbody):
+                cells = CELL_XPATH(row)
                 if cells:
-                    row_data = [cell.get_text(strip=True) for cell in cells]
+                    row_data = [self.cell_text(cell) for cell in cells]
                     page_data.append(row_data)
 
             return headers, page_data
@@ -228,27 +329,86 @@ class FinalMultiSubsidiaryScraper:
             logger.error(f"Error extracting page data: {str(e)}")
             return [], []
 
-    def save_data_batch(self, subsidiary_info, headers, data_batch, file_path, write_headers=False):
-        """Save a batch of data to CSV"""
-        try:
-            mode = 'w' if write_headers else 'a'
-            with open(file_path, mode, newline='', encoding='utf-8') as file:
-                writer = csv.writer(file)
-
-                if write_headers:
-                    # Add subsidiary columns to headers
-                    enhanced_headers = ['subsidiary_name', 'subsidiary_id'] + headers
-                    writer.writerow(enhanced_headers)
-
-                # Write data with subsidiary info
-                for row in data_batch:
-                    enhanced_row = [subsidiary_info['name'], subsidiary_info['id']] + row
-                    writer.writerow(enhanced_row)
-
-            logger.info(f"Saved {len(data_batch)} rows to file")
-
-        except Exception as e:
-            logger.error(f"Error saving data batch: {str(e)}")
+    def find_last_page(self):
+        """Highest page number linked from the last parsed page's pagination, None without pagination"""
+        hrefs = PAGINATION_HREF_XPATH(self.local.page_tree)
+        page_numbers = [int(match.group(1)) for match in map(PAGE_PARAM_PATTERN.search, hrefs) if match]
+        return max(page_numbers, default=None)
+
+    def scrape_page(self, page_url, use_browser=False):
+        """Fetch one page and return its (headers, rows), or None once the page is empty"""
+        has_content, row_count = self.validate_page_content(page_url, use_browser)
+        if not has_content:
+            return None
+        return self.extract_page_data()
+
+    def record_first_page(self, subsidiary_info, fingerprint):
+        """Record a subsidiary's first-page fingerprint once and wake the workers waiting on it"""
+        with self.first_pages_ready:
+            self.first_pages.setdefault(subsidiary_info['name'], fingerprint)
+            self.first_pages_ready.notify_all()
+
+    def is_duplicate_listing(self, subsidiary_info, first_page_rows):
+        """Record a subsidiary's first page, True if a subsidiary listed before it shows the same contracts"""
+        fingerprint = hash(tuple(map(tuple, first_page_rows)))
+        self.record_first_page(subsidiary_info, fingerprint)
+
+        # Decided in config order rather than by which worker gets there first, so every run keeps the same copy.
+        # Earlier subsidiaries were submitted first, so they are already running or done
+        names = [info['name'] for info in self.config.SUBSIDIARIES.values()]
+        earlier = names[:names.index(subsidiary_info['name'])]
+        with self.first_pages_ready:
+            self.first_pages_ready.wait_for(lambda: all(name in self.first_pages for name in earlier))
+            scraped_as = next((name for name in earlier if self.first_pages[name] == fingerprint), None)
+        if scraped_as:
+            logger.warning(f"{subsidiary_info['name']} lists the same contracts as {scraped_as}, skipping it")
+            return True
+        return False
+
+    def iter_subsidiary_pages(self, subsidiary_info):
+        """Yield (page, headers, rows) for each page of a subsidiary in order, up to the first empty page"""
+        page_prefix = self.config.BASE_URL.format(subsidiary_info['id']) + "?page="
+
+        # Page 1 alone decides whether this listing needs Chrome; a later page without a table is past the end
+        use_browser = False
+        first_page = self.scrape_page(page_prefix + "1")
+        if first_page is None and self.local.page_tree is not None and self.local.page_tree.find('.//table') is None:
+            logger.warning(f"No table in the server response for {subsidiary_info['name']}, falling back to Selenium")
+            use_browser = True
+            first_page = self.scrape_page(page_prefix + "1", use_browser)
+        if first_page is None:
+            return
+
+        # Some entities are registered under several ids that resolve to the same listing
+        if self.is_duplicate_listing(subsidiary_info, first_page[1]):
+            return
+        yield (1,) + first_page
+        page = 2
+
+        # Page 1's pagination tells how many pages there are, so those are fetched in parallel
+        last_page = self.find_last_page()
+        if last_page and last_page > 1:
+            page_urls = [page_prefix + str(number) for number in range(2, last_page + 1)]
+            executor = ThreadPoolExecutor(max_workers=self.config.PAGE_WORKERS)
+            try:
+                futures = [executor.submit(self.scrape_page, page_url, use_browser) for page_url in page_urls]
+                for future in futures:
+                    page_result = future.result()
+                    if page_result is None:
+                        return
+                    yield (page,) + page_result
+                    page += 1
+            finally:
+                # Drop the fetches still queued behind an empty page instead of waiting them out
+                executor.shutdown(cancel_futures=True)
+
+        # Continue one page at a time until an empty page, in case the pagination only links a window of pages
+        while True:
+            page_result = self.scrape_page(page_prefix + str(page), use_browser)
+            if page_result is None:
+                return
+            yield (page,) + page_result
+            page += 1
 
     def scrape_subsidiary(self, subsidiary_key, subsidiary_info):
         """Scrape all pages for one subsidiary"""
@@ -259,77 +419,71 @@ class FinalMultiSubsidiaryScraper:
         filename = f"final_{subsidiary_key}_{timestamp}.csv"
         file_path = os.path.join(self.config.OUTPUT_DIR, filename)
 
-        page = 1
+        pages_scraped = 0
         headers = []
-        all_data = []
         total_rows = 0
-        headers_written = False
-
-        while True:
-            page_url = f"{subsidiary_info['url']}?page={page}"
-            logger.info(f"Scraping page {page} for {subsidiary_info['name']}")
-
-            # Validate page content
-            has_content, row_count = self.validate_page_content(page_url)
-
-            if not has_content:
-                logger.info(f"Empty page found at page {page}. Scraping complete for {subsidiary_info['name']}")
-                break
-
-            # Extract data
-            page_headers, page_data = self.extract_page_data()
-
-            # Set headers from first page
-            if not headers and page_headers:
-                headers = page_headers
+        output_file = None
+        writer = None
 
-            if page_data:
-                all_data.extend(page_data)
-                total_rows += len(page_data)
-                logger.info(f"Extracted {len(page_data)} rows from page {page}")
-
-                # Write batch if we've reached batch size
-                if len(all_data) >= self.config.BATCH_SIZE:
-                    self.save_data_batch(subsidiary_info, headers, all_data, file_path, not headers_written)
-                    headers_written = True
-                    all_data = []  # Clear batch
-
-            page += 1
-            time.sleep(1)  # Be respectful
-
-        # Write remaining data
-        if all_data:
-            self.save_data_batch(subsidiary_info, headers, all_data, file_path, not headers_written)
+        try:
+            for page, page_headers, page_data in self.iter_subsidiary_pages(subsidiary_info):
+                pages_scraped = page
+
+                # Set headers from first page
+                if not headers and page_headers:
+                    headers = page_headers
+
+                if page_data:
+                    # Open the file on the first rows so subsidiaries without contracts leave no empty file
+                    if writer is None:
+                        output_file = open(file_path, 'w', newline='', encoding='utf-8',
+                                           buffering=self.config.WRITE_BUFFER_SIZE)
+                        writer = csv.writer(output_file)
+                        writer.writerow(['subsidiary_name', 'subsidiary_id'] + headers)
+
+                    # Stream the page straight to disk with subsidiary info prepended
+                    writer.writerows([subsidiary_info['name'], subsidiary_info['id']] + row for row in page_data)
+                    total_rows += len(page_data)
+                    logger.info(f"Extracted {len(page_data)} rows from page {page} for {subsidiary_info['name']}")
+        finally:
+            if output_file:
+                output_file.close()
+            # A subsidiary without a first page, or one that failed, must not keep later ones waiting
+            self.record_first_page(subsidiary_info, None)
 
-        logger.info(f"Completed {subsidiary_info['name']}: {page-1} pages, {total_rows} total rows")
+        logger.info(f"Completed {subsidiary_info['name']}: {pages_scraped} pages, {total_rows} total rows")
         return total_rows
 
     def scrape_all_subsidiaries(self):
         """Scrape all subsidiaries"""
         try:
-            self.setup_driver()
             total_subsidiaries = len(self.config.SUBSIDIARIES)
             grand_total_rows = 0
 
-            logger.info(f"Starting to scrape {total_subsidiaries} subsidiaries")
+            logger.info(f"Starting to scrape {total_subsidiaries} subsidiaries with {self.config.MAX_WORKERS} workers")
 
-            for i, (subsidiary_key, subsidiary_info) in enumerate(self.config.SUBSIDIARIES.items(), 1):
-                logger.info(f"Processing subsidiary {i}/{total_subsidiaries}: {subsidiary_info['name']}")
+            # Each subsidiary writes its own file, so workers never share an output handle
+            with ThreadPoolExecutor(max_workers=self.config.MAX_WORKERS) as executor:
+                futures = {
+                    executor.submit(self.scrape_subsidiary, subsidiary_key, subsidiary_info): subsidiary_info
+                    for subsidiary_key, subsidiary_info in self.config.SUBSIDIARIES.items()
+                }
 
-                try:
-                    rows_scraped = self.scrape_subsidiary(subsidiary_key, subsidiary_info)
-                    grand_total_rows += rows_scraped
-                except Exception as e:
-                    logger.error(f"Failed to scrape {subsidiary_info['name']}: {str(e)}")
-                    continue
+                for i, future in enumerate(as_completed(futures), 1):
+                    subsidiary_info = futures[future]
+                    try:
+                        rows_scraped = future.result()
+                        grand_total_rows += rows_scraped
+                        logger.info(f"Finished subsidiary {i}/{total_subsidiaries}: {subsidiary_info['name']}")
+                    except Exception as e:
+                        logger.error(f"Failed to scrape {subsidiary_info['name']}: {str(e)}")
 
             logger.info(f"Multi-subsidiary scraping completed. Total rows: {grand_total_rows}")
 
         except Exception as e:
             logger.error(f"Error during multi-subsidiary scraping: {str(e)}")
         finally:
-            if self.driver:
-                self.driver.quit()
+            self.close()
 
 def test_single_subsidiary(start_page=105):
     """Test with single subsidiary starting from specific page"""
@@ -339,12 +493,11 @@ def test_single_subsidiary(start_page=105):
     subsidiary_info = scraper.config.SUBSIDIARIES["obb_business"]
 
     try:
-        scraper.setup_driver()
         page = start_page
         found_empty = False
 
         while not found_empty and page < start_page + 20:  # Test max 20 pages
-            page_url = f"{subsidiary_info['url']}?page={page}"
+            page_url = scraper.config.BASE_URL.format(subsidiary_info['id']) + f"?page={page}"
             print(f"📄 Testing page {page}")
 
             has_content, row_count = scraper.validate_page_content(page_url)
@@ -361,8 +514,7 @@ def test_single_subsidiary(start_page=105):
             print(f"⚠️  No empty page found in {page - start_page} pages tested")
 
     finally:
-        if scraper.driver:
-            scraper.driver.quit()
+        scraper.close()
 
 if __name__ == "__main__":
     # Test single subsidiary
@@ -13,11 +13,13 @@ import streamlit as st
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import numpy as np
 from datetime import datetime, timedelta
 import re
+import io
 from collections import Counter
+from functools import lru_cache
+from itertools import cycle, islice
 import os
 
 # Custom Color Palette
@@ -33,6 +35,56 @@ CUSTOM_COLORS = {
     'white': 'rgb(255,255,255)'        # White
 }
 
+# Order in which chart series pick up the custom colors
+CUSTOM_PALETTE = (
+    CUSTOM_COLORS['primary'], CUSTOM_COLORS['secondary'], CUSTOM_COLORS['gray1'],
+    CUSTOM_COLORS['gray2'], CUSTOM_COLORS['gray3'], CUSTOM_COLORS['gray4'],
+    CUSTOM_COLORS['light_gray'], CUSTOM_COLORS['black']
+)
+
+# Company bar charts plot at most this many companies, the summary table still lists all of them
+MAX_COMPANY_BARS = 25
+
+# Quadrant labels of the consulting positioning chart: x, y, text, colour
+POSITIONING_QUADRANTS = (
+    (25, 75, "High Value<br>High Competition", "gray"),
+    (75, 75, "Sweet Spot<br>High Value, Low Competition", "darkgreen"),
+    (25, 25, "Challenging<br>Low Value, High Competition", "darkred"),
+    (75, 25, "Low Value<br>Low Competition", "gray"),
+)
+
+# Contract size buckets behind the value filter buttons, upper bounds are inclusive
+SIZE_BUCKET_EDGES = [0, 50000, 500000, 2000000, float('inf')]
+SIZE_BUCKETS = ['small', 'medium', 'large', 'xl']
+
+# Preset contract size filters shown above the value sliders
+VALUE_FILTER_LABELS = {
+    "all": "All Contracts",
+    "small": "Small (€0-50K)",
+    "medium": "Medium (€50K-500K)",
+    "large": "Large (€500K-2M)",
+    "xl": "XL (€2M+)"
+}
+
+# Filter and widget state cleared when switching back to the original data
+DASHBOARD_STATE_KEYS = frozenset(
+    [f'{prefix}_filter' for prefix in ('market', 'consulting')]
+    + [f'{prefix}_{bucket}_slider' for prefix in ('market', 'consulting') for bucket in SIZE_BUCKETS]
+    + ['category_top_n']
+)
+
+# Scraper columns the dashboard works with, uploads must have them and everything else is skipped
+DATA_COLUMNS = [
+    'Bezeichnung', 'Lieferant', 'Kategorie (CPV Hauptteil)',
+    'Bieter', 'Summe', 'Aktualisiert'
+]
+
+# Text columns are read as strings so pandas doesn't spend time inferring their types
+TEXT_COLUMN_DTYPES = {
+    'Bezeichnung': str, 'Lieferant': str, 'Kategorie (CPV Hauptteil)': str,
+    'Summe': str, 'Aktualisiert': str
+}
+
 # Define consulting companies for filtering
 CONSULTING_COMPANIES = [
     'Accenture', 'Deloitte', 'PwC', 'KPMG', 'McKinsey', 'BCG', 'Bain',
@@ -43,6 +95,14 @@ CONSULTING_COMPANIES = [
     'Sopra Steria', 'T-Systems', 'Fujitsu', 'NEC', 'Unisys', 'Horvath & Partner'
 ]
 
+# One alternation pattern so each supplier name is scanned once instead of once per company
+CONSULTING_PATTERN = re.compile('|'.join(re.escape(company) for company in CONSULTING_COMPANIES))
+
+# Patterns used while cleaning the raw scraper columns
+CONTRACT_VALUE_PATTERN = re.compile(r'(\d+\.?\d*)')
+CPV_CODE_PATTERN = re.compile(r'(\d+)')
+CPV_PREFIX_PATTERN = re.compile(r'^\d+\s*')
+
 def get_image_path(filename):
     """Get the correct path for image files regardless of deployment environment"""
     possible_paths = [
@@ -59,12 +119,21 @@ def get_image_path(filename):
     # If no image found, return None so we can handle gracefully
     return None
 
+@st.cache_resource(show_spinner=False)
+def load_image_bytes(image_path):
+    """Read a logo once per process, the encoded bytes go to st.image as-is so nothing is decoded"""
+    full_path = get_image_path(image_path)
+    if full_path is None:
+        return None
+    with open(full_path, 'rb') as f:
+        return f.read()
+
 def safe_display_image(image_path, **kwargs):
     """Safely display an image, with fallback if not found"""
-    full_path = get_image_path(image_path)
-    if full_path and os.path.exists(full_path):
+    image_bytes = load_image_bytes(image_path)
+    if image_bytes is not None:
         try:
-            st.image(full_path, **kwargs)
+            st.image(image_bytes, **kwargs)
         except Exception as e:
             # If image fails to load, show a placeholder or skip
             st.write(f"*[{image_path} - logo placeholder]*")
@@ -114,13 +183,8 @@ st.markdown(f"""
 
 def validate_csv_format(uploaded_df):
     """Validate that uploaded CSV has the correct format"""
-    required_columns = [
-        'Bezeichnung', 'Lieferant', 'Kategorie (CPV Hauptteil)', 
-        'Bieter', 'Summe', 'Aktualisiert'
-    ]
-    
     # Check if all required columns exist
-    missing_columns = [col for col in required_columns if col not in uploaded_df.columns]
+    missing_columns = [col for col in DATA_COLUMNS if col not in uploaded_df.columns]
     if missing_columns:
         raise ValueError(f"Missing required columns: {', '.join(missing_columns)}")
     
@@ -137,38 +201,56 @@ def validate_csv_format(uploaded_df):
     
     return True
 
+def parse_contract_value(value):
+    """Turn a German formatted amount like '77.495,00' into a numeric string"""
+    if not isinstance(value, str):
+        return None
+    match = CONTRACT_VALUE_PATTERN.search(value.replace('.', '').replace(',', '.'))
+    return match.group(1) if match else None
+
+def split_cpv_category(category):
+    """Split a 'CPV code + description' entry into its code and description"""
+    if not isinstance(category, str):
+        return None, None
+    code = CPV_CODE_PATTERN.search(category)
+    return (code.group(1) if code else None), CPV_PREFIX_PATTERN.sub('', category, count=1)
+
 def process_dataframe(df):
     """Process DataFrame with all cleaning and consulting identification"""
     # Clean and preprocess data
-    df['Aktualisiert'] = pd.to_datetime(df['Aktualisiert'], format='%d.%m.%Y', errors='coerce')
+    df['Aktualisiert'] = pd.to_datetime(df['Aktualisiert'], format='%d.%m.%Y', errors='coerce', cache=True)
+    
+    # Month bucket used by the monthly charts
+    df['YearMonth'] = df['Aktualisiert'].dt.to_period('M')
     
     # Clean contract values
-    df['Summe_Clean'] = df['Summe'].str.replace('.', '').str.replace(',', '.').str.extract(r'(\d+\.?\d*)')[0]
-    df['Summe_Clean'] = pd.to_numeric(df['Summe_Clean'], errors='coerce')
+    df['Summe_Clean'] = pd.to_numeric([parse_contract_value(value) for value in df['Summe']], errors='coerce')
+    
+    # Bidder counts are small whole numbers, float32 holds them exactly and keeps missing counts as NaN
+    df['Bieter'] = pd.to_numeric(df['Bieter'], errors='coerce').astype('float32')
     
     # Extract CPV category numbers
-    df['CPV_Code'] = df['Kategorie (CPV Hauptteil)'].str.extract(r'(\d+)')[0]
-    df['CPV_Category'] = df['Kategorie (CPV Hauptteil)'].str.replace(r'^\d+\s*', '', regex=True)
+    cpv_parts = [split_cpv_category(category) for category in df['Kategorie (CPV Hauptteil)']]
+    df['CPV_Code'] = [code for code, _ in cpv_parts]
+    df['CPV_Category'] = [category for _, category in cpv_parts]
     
     # Company cleaning
     df['Lieferant_Clean'] = df['Lieferant'].str.strip()
     
-    # Identify consulting companies
-    df['Is_Consulting'] = df['Lieferant_Clean'].apply(
-        lambda x: any(consulting in str(x) for consulting in CONSULTING_COMPANIES) if pd.notna(x) else False
-    )
+    # Identify consulting companies, matching each distinct supplier name only once
+    suppliers = df['Lieferant_Clean'].dropna().unique()
+    consulting_suppliers = {supplier for supplier in suppliers if CONSULTING_PATTERN.search(supplier)}
+    df['Is_Consulting'] = df['Lieferant_Clean'].isin(consulting_suppliers)
     
-    # Extract consulting companies found in data
-    consulting_matches = []
-    for company in df['Lieferant_Clean'].dropna():
-        for consulting in CONSULTING_COMPANIES:
-            if consulting.lower() in company.lower():
-                consulting_matches.append(company)
-                break
+    # Keep the supplier name for consulting companies only
+    df['Consulting_Company'] = df['Lieferant_Clean'].where(df['Is_Consulting'])
     
-    df['Consulting_Company'] = df['Lieferant_Clean'].apply(
-        lambda x: x if x in consulting_matches else None
-    )
+    # Size bucket per contract so the value filter buttons compare small integer codes
+    df['Size_Bucket'] = pd.cut(df['Summe_Clean'], SIZE_BUCKET_EDGES, labels=SIZE_BUCKETS, include_lowest=True)
+    
+    # Repeating string columns as categories so groupbys and counts work on integer codes
+    for column in ['Lieferant_Clean', 'CPV_Category', 'CPV_Code', 'Consulting_Company']:
+        df[column] = df[column].astype('category')
     
     return df
 
@@ -188,8 +270,23 @@ def load_data():
     for path in possible_paths:
         try:
             if os.path.exists(path):
-                df = pd.read_csv(path)
-                return process_dataframe(df)
+                # Reuse the preprocessed Parquet copy unless the CSV or this preprocessing code changed since
+                cache_path = os.path.splitext(path)[0] + '.parquet'
+                source_mtime = max(os.path.getmtime(path), os.path.getmtime(__file__))
+                if os.path.exists(cache_path) and os.path.getmtime(cache_path) >= source_mtime:
+                    return pd.read_parquet(cache_path)
+                
+                df = process_dataframe(pd.read_csv(
+                    path, usecols=lambda column: column in DATA_COLUMNS, dtype=TEXT_COLUMN_DTYPES
+                ))
+                
+                # The Parquet copy is only a speed-up, so a failed write shouldn't stop the dashboard
+                try:
+                    df.to_parquet(cache_path, engine='pyarrow', compression='zstd')
+                except Exception:
+                    pass
+                
+                return df
         except:
             continue
     
@@ -197,16 +294,116 @@ def load_data():
     st.error("❌ Data file 'single_subsidiary_data.csv' not found. Please run the single subsidiary scraper first or upload your own data using the sidebar.")
     return pd.DataFrame()
 
+@st.cache_data(show_spinner="Parsing CSV...")
+def load_uploaded_data(file_bytes):
+    """Parse, validate and process an uploaded CSV, cached on the file contents"""
+    uploaded_df = pd.read_csv(
+        io.BytesIO(file_bytes),
+        usecols=lambda column: column in DATA_COLUMNS,
+        dtype=TEXT_COLUMN_DTYPES
+    )
+    validate_csv_format(uploaded_df)
+    return process_dataframe(uploaded_df)
+
+@lru_cache(maxsize=None)
 def get_custom_colors(n):
     """Get custom color palette for n items"""
-    colors = [
-        CUSTOM_COLORS['primary'], CUSTOM_COLORS['secondary'], CUSTOM_COLORS['gray1'],
-        CUSTOM_COLORS['gray2'], CUSTOM_COLORS['gray3'], CUSTOM_COLORS['gray4'],
-        CUSTOM_COLORS['light_gray'], CUSTOM_COLORS['black']
-    ]
-    return colors[:n] if n <= len(colors) else colors * (n // len(colors) + 1)
+    return tuple(islice(cycle(CUSTOM_PALETTE), n))
+
+def top_counts(series, n):
+    """Get the n most frequent values, skipping categories without any rows"""
+    counts = series.value_counts()
+    return counts[counts > 0].head(n)
 
-def create_market_overview(df):
+def value_range_rows(df, bucket, value_range, bucket_range):
+    """Rows with a contract value in the selected range, read off the size bucket while the slider spans the whole bucket"""
+    if value_range == bucket_range:
+        return df[df['Size_Bucket'] == bucket]
+    min_value, max_value = value_range
+    # Sorted per call, hashing the frame for a cache lookup costs more than the argsort itself
+    values = df['Summe_Clean'].to_numpy()
+    order = np.argsort(values, kind='stable')
+    sorted_values = values[order]
+    # Buckets include their upper edge only, so a lower bound on an inner edge belongs to the bucket below
+    lower_side = 'right' if min_value in SIZE_BUCKET_EDGES[1:-1] else 'left'
+    lo = np.searchsorted(sorted_values, min_value, side=lower_side)
+    hi = np.searchsorted(sorted_values, max_value, side='right')
+    # Back to frame order so ties downstream rank as before
+    return df.iloc[np.sort(order[lo:hi])]
+
+def supplier_options(suppliers):
+    """Sorted supplier names for the company selectors, read off the category order instead of sorting strings"""
+    return suppliers.cat.remove_unused_categories().cat.categories.tolist()
+
+def supplier_values(df):
+    """Total contract value per supplier, largest first, shared by the top-N charts and metrics"""
+    return df.groupby('Lieferant_Clean', observed=True)['Summe_Clean'].sum().sort_values(ascending=False)
+
+@st.cache_resource
+def share_pie_chart(items, title, colors):
+    """Build a market share pie chart from (label, value) pairs, reused across reruns"""
+    fig = px.pie(
+        values=[value for _, value in items],
+        names=[label for label, _ in items],
+        title=title,
+        color_discrete_sequence=colors
+    )
+    fig.update_layout(title_font_color=CUSTOM_COLORS['primary'])
+    return fig
+
+@st.cache_resource
+def top_bar_chart(items, title, colors, height=None):
+    """Build a horizontal bar chart from (label, value) pairs, reused across reruns"""
+    fig = px.bar(
+        x=[value for _, value in items],
+        y=[label for label, _ in items],
+        orientation='h',
+        title=title,
+        color_discrete_sequence=colors
+    )
+    fig.update_layout(
+        showlegend=False,
+        height=height,
+        title_font_color=CUSTOM_COLORS['primary']
+    )
+    return fig
+
+# The page aggregates below are cached per frame, so reruns triggered by unrelated
+# widgets or by switching pages and back only pay for hashing the frame
+
+@st.cache_data(show_spinner=False)
+def consulting_firm_summary(consulting_df):
+    """Per-firm contract count, value and competition, largest total value first"""
+    summary = consulting_df.groupby('Lieferant_Clean', observed=True).agg({
+        'Summe_Clean': ['count', 'sum', 'mean'],
+        'Bieter': 'mean'
+    }).round(2)
+    
+    summary.columns = ['Contracts', 'Total Value (€)', 'Avg Value (€)', 'Avg Competition']
+    return summary.sort_values('Total Value (€)', ascending=False)
+
+@st.cache_data(show_spinner=False)
+def monthly_trends(df, start_date, end_date):
+    """Monthly contract counts and values, overall and for consulting, between two dates"""
+    mask = (df['Aktualisiert'].dt.date >= start_date) & (df['Aktualisiert'].dt.date <= end_date)
+    df_filtered = df[mask]
+    
+    # Overall monthly trends, grouped on the YearMonth column built at load
+    monthly_all = df_filtered.groupby('YearMonth').agg({
+        'Summe_Clean': ['count', 'sum']
+    })
+    monthly_all.columns = ['Total_Contracts', 'Total_Value']
+    
+    # Consulting monthly trends
+    consulting_monthly = df_filtered[df_filtered['Is_Consulting']].groupby('YearMonth').agg({
+        'Summe_Clean': ['count', 'sum']
+    })
+    consulting_monthly.columns = ['Consulting_Contracts', 'Consulting_Value']
+    
+    # Combine data
+    return monthly_all.join(consulting_monthly, how='left').fillna(0)
+
+def create_market_overview(df, consulting_df):
     """Create balanced market overview with consulting insights"""
     if df.empty:
         return
@@ -222,13 +419,14 @@ def create_market_overview(df):
     # Executive Summary KPIs
     st.markdown('<div class="section-header">🎯 Executive Summary</div>', unsafe_allow_html=True)
     
-    # Calculate key metrics
-    consulting_df = df[df['Is_Consulting'] == True]
+    # Calculate key metrics, with the market and consulting reductions done in one agg call each
+    market_stats = df[['Summe_Clean', 'Bieter']].agg(['sum', 'mean'])
+    consulting_stats = consulting_df['Summe_Clean'].agg(['sum', 'mean'])
     total_contracts = len(df)
-    total_value = df['Summe_Clean'].sum()
-    consulting_value = consulting_df['Summe_Clean'].sum()
+    total_value = market_stats.at['sum', 'Summe_Clean']
+    consulting_value = consulting_stats['sum']
     consulting_share = (consulting_value / total_value) * 100 if total_value > 0 else 0
-    avg_competition = df['Bieter'].mean()
+    avg_competition = market_stats.at['mean', 'Bieter']
     
     # Executive KPI Cards
     col1, col2, col3, col4 = st.columns(4)
@@ -262,7 +460,7 @@ def create_market_overview(df):
     
     with col4:
         # Market concentration
-        top5_value = df.groupby('Lieferant_Clean')['Summe_Clean'].sum().sort_values(ascending=False).head(5).sum()
+        top5_value = supplier_values(df).head(5).sum()
         concentration = (top5_value / total_value) * 100 if total_value > 0 else 0
         
         st.markdown(f"""
@@ -280,33 +478,26 @@ def create_market_overview(df):
     
     with col1:
         # Top companies overall with consulting highlighted
-        top_companies = df['Lieferant_Clean'].value_counts().head(15)
+        top_companies = top_counts(df['Lieferant_Clean'], 15)
         
         # Create color map - consulting companies get McKinsey accent colors, others get gray
-        colors = []
-        for company in top_companies.index:
-            if df[df['Lieferant_Clean'] == company]['Is_Consulting'].iloc[0]:
-                colors.append(CUSTOM_COLORS['secondary'])  # Consulting companies in bright blue
-            else:
-                colors.append(CUSTOM_COLORS['gray1'])  # Non-consulting in gray
+        # Consulting flag per supplier, looked up once per bar instead of filtering the frame
+        is_consulting = df.groupby('Lieferant_Clean', observed=True, sort=False)['Is_Consulting'].first()
+        colors = [
+            CUSTOM_COLORS['secondary'] if is_consulting[company] else CUSTOM_COLORS['gray1']
+            for company in top_companies.index
+        ]
         
-        fig_companies = px.bar(
-            x=top_companies.values,
-            y=top_companies.index,
-            orientation='h',
-            title="Top 15 Companies by Contract Count (Consulting Highlighted)",
-            color_discrete_sequence=colors
-        )
-        fig_companies.update_layout(
-            showlegend=False,
-            height=500,
-            title_font_color=CUSTOM_COLORS['primary']
+        fig_companies = top_bar_chart(
+            tuple(top_companies.items()),
+            "Top 15 Companies by Contract Count (Consulting Highlighted)",
+            colors,
+            height=500
         )
         st.plotly_chart(fig_companies, use_container_width=True)
     
     with col2:
         # Market share by value with consulting split
-        consulting_value = consulting_df['Summe_Clean'].sum()
         non_consulting_value = total_value - consulting_value
         
         split_data = pd.DataFrame({
@@ -337,8 +528,8 @@ def create_market_overview(df):
             st.metric("Consulting Firms Active", f"{consulting_companies}")
         
         with col2:
-            avg_consulting_value = consulting_df['Summe_Clean'].mean()
-            avg_overall_value = df['Summe_Clean'].mean()
+            avg_consulting_value = consulting_stats['mean']
+            avg_overall_value = market_stats.at['mean', 'Summe_Clean']
             premium = ((avg_consulting_value/avg_overall_value - 1) * 100) if avg_overall_value > 0 else 0
             st.metric("Consulting Premium", f"{premium:+.1f}%", "vs market average")
         
@@ -357,7 +548,7 @@ def create_company_analysis(df):
     st.markdown("<br>", unsafe_allow_html=True)
     
     # Company selection
-    companies = sorted(df['Lieferant_Clean'].dropna().unique())
+    companies = supplier_options(df['Lieferant_Clean'])
     selected_companies = st.multiselect(
         "Select companies to analyze:",
         companies,
@@ -372,12 +563,24 @@ def create_company_analysis(df):
     # Filter data for selected companies
     company_df = df[df['Lieferant_Clean'].isin(selected_companies)]
     
+    # One named aggregation feeds both charts and the summary table, the average is derived from sum and count
+    company_summary = company_df.groupby('Lieferant_Clean', observed=True).agg(
+        Rows=('Summe_Clean', 'size'),
+        Contracts=('Summe_Clean', 'count'),
+        Total=('Summe_Clean', 'sum'),
+        Max=('Summe_Clean', 'max'),
+        AvgComp=('Bieter', 'mean'),
+        First=('Aktualisiert', 'min'),
+        Last=('Aktualisiert', 'max')
+    )
+    company_summary.insert(3, 'Avg', company_summary['Total'] / company_summary['Contracts'])
+    
     # Company metrics
     col1, col2 = st.columns(2)
     
     with col1:
         # Contract count by company
-        contract_counts = company_df.groupby('Lieferant_Clean').size().sort_values(ascending=False)
+        contract_counts = company_summary['Rows'].sort_values(ascending=False).head(MAX_COMPANY_BARS)
         fig_contracts = px.bar(
             x=contract_counts.values,
             y=contract_counts.index,
@@ -390,7 +593,7 @@ def create_company_analysis(df):
     
     with col2:
         # Total value by company
-        value_by_company = company_df.groupby('Lieferant_Clean')['Summe_Clean'].sum().sort_values(ascending=False)
+        value_by_company = company_summary['Total'].sort_values(ascending=False).head(MAX_COMPANY_BARS)
         fig_value = px.bar(
             x=value_by_company.values,
             y=value_by_company.index,
@@ -403,11 +606,7 @@ def create_company_analysis(df):
     
     # Detailed company table
     st.subheader("📋 Company Performance Summary")
-    company_summary = company_df.groupby('Lieferant_Clean').agg({
-        'Summe_Clean': ['count', 'sum', 'mean', 'max'],
-        'Bieter': 'mean',
-        'Aktualisiert': ['min', 'max']
-    }).round(2)
+    company_summary = company_summary.drop(columns='Rows').round(2)
     
     company_summary.columns = ['Contracts', 'Total Value (€)', 'Avg Value (€)', 'Max Value (€)', 
                              'Avg Competitors', 'First Contract', 'Last Contract']
@@ -415,7 +614,7 @@ def create_company_analysis(df):
     
     st.dataframe(company_summary, use_container_width=True)
 
-def create_market_share_analysis(df):
+def create_market_share_analysis(df, consulting_df):
     """Create market share analysis with McKinsey colors and consulting highlights"""
     # Add Horvath & Partners logo to top right
     col1, col2 = st.columns([3, 1])
@@ -425,71 +624,46 @@ def create_market_share_analysis(df):
     st.markdown('<div class="main-header">📈 Market Share Analysis</div>', unsafe_allow_html=True)
     st.markdown("<br>", unsafe_allow_html=True)
     
+    # Supplier totals computed once per render, the pie chart and the concentration metric share them
+    company_values = supplier_values(df)
+    
     col1, col2 = st.columns(2)
     
     with col1:
         # Market share by contract count
-        top_companies_count = df['Lieferant_Clean'].value_counts().head(12)
+        top_companies_count = top_counts(df['Lieferant_Clean'], 12)
         colors = get_custom_colors(len(top_companies_count))
         
-        fig_pie_count = px.pie(
-            values=top_companies_count.values,
-            names=top_companies_count.index,
-            title="Market Share by Contract Count (Top 12)",
-            color_discrete_sequence=colors
+        fig_pie_count = share_pie_chart(
+            tuple(top_companies_count.items()),
+            "Market Share by Contract Count (Top 12)",
+            colors
         )
-        fig_pie_count.update_layout(title_font_color=CUSTOM_COLORS['primary'])
         st.plotly_chart(fig_pie_count, use_container_width=True)
     
     with col2:
         # Market share by value
-        top_companies_value = df.groupby('Lieferant_Clean')['Summe_Clean'].sum().sort_values(ascending=False).head(12)
+        top_companies_value = company_values.head(12)
         colors = get_custom_colors(len(top_companies_value))
         
-        fig_pie_value = px.pie(
-            values=top_companies_value.values,
-            names=top_companies_value.index,
-            title="Market Share by Value (Top 12)",
-            color_discrete_sequence=colors
+        fig_pie_value = share_pie_chart(
+            tuple(top_companies_value.items()),
+            "Market Share by Value (Top 12)",
+            colors
         )
-        fig_pie_value.update_layout(title_font_color=CUSTOM_COLORS['primary'])
         st.plotly_chart(fig_pie_value, use_container_width=True)
     
     # Contract value filter for market share analysis
     st.subheader("🔧 Filter by Contract Value")
     
-    # Preset value range options
-    col1, col2, col3, col4, col5 = st.columns(5)
-    
-    with col1:
-        if st.button("All Contracts", key="market_all", type="secondary"):
-            st.session_state.market_filter = "all"
-    with col2:
-        if st.button("Small (€0-50K)", key="market_small", type="secondary"):
-            st.session_state.market_filter = "small"
-    with col3:
-        if st.button("Medium (€50K-500K)", key="market_medium", type="secondary"):
-            st.session_state.market_filter = "medium"
-    with col4:
-        if st.button("Large (€500K-2M)", key="market_large", type="secondary"):
-            st.session_state.market_filter = "large"
-    with col5:
-        if st.button("XL (€2M+)", key="market_xl", type="secondary"):
-            st.session_state.market_filter = "xl"
-    
-    # Initialize filter if not set
-    if 'market_filter' not in st.session_state:
-        st.session_state.market_filter = "all"
-    
-    # Show current selection
-    filter_labels = {
-        "all": "All Contracts",
-        "small": "Small (€0-50K)", 
-        "medium": "Medium (€50K-500K)",
-        "large": "Large (€500K-2M)",
-        "xl": "XL (€2M+)"
-    }
-    st.info(f"**Current filter:** {filter_labels[st.session_state.market_filter]}")
+    # Preset value range options, the radio keeps the selection in session state
+    st.radio(
+        "Contract size",
+        list(VALUE_FILTER_LABELS),
+        format_func=VALUE_FILTER_LABELS.get,
+        horizontal=True,
+        key="market_filter"
+    )
     
     # Apply filter based on selection and add adaptive slider
     if st.session_state.market_filter == "small":
@@ -542,36 +716,32 @@ def create_market_share_analysis(df):
     
     # Apply filter and show filtered results if different
     if st.session_state.market_filter != "all":
-        df_filtered = df[(df['Summe_Clean'] >= min_value) & (df['Summe_Clean'] <= max_value)]
+        df_filtered = value_range_rows(df, st.session_state.market_filter, (min_value, max_value), (range_min, range_max))
         if not df_filtered.empty:
             st.info(f"Showing results for {len(df_filtered):,} contracts (filtered from {len(df):,})")
             
             col1_f, col2_f = st.columns(2)
             
             with col1_f:
-                top_companies_count_f = df_filtered['Lieferant_Clean'].value_counts().head(12)
+                top_companies_count_f = top_counts(df_filtered['Lieferant_Clean'], 12)
                 colors = get_custom_colors(len(top_companies_count_f))
                 
-                fig_pie_count_f = px.pie(
-                    values=top_companies_count_f.values,
-                    names=top_companies_count_f.index,
-                    title="Filtered: Market Share by Contract Count",
-                    color_discrete_sequence=colors
+                fig_pie_count_f = share_pie_chart(
+                    tuple(top_companies_count_f.items()),
+                    "Filtered: Market Share by Contract Count",
+                    colors
                 )
-                fig_pie_count_f.update_layout(title_font_color=CUSTOM_COLORS['primary'])
                 st.plotly_chart(fig_pie_count_f, use_container_width=True)
             
             with col2_f:
-                top_companies_value_f = df_filtered.groupby('Lieferant_Clean')['Summe_Clean'].sum().sort_values(ascending=False).head(12)
+                top_companies_value_f = supplier_values(df_filtered).head(12)
                 colors = get_custom_colors(len(top_companies_value_f))
                 
-                fig_pie_value_f = px.pie(
-                    values=top_companies_value_f.values,
-                    names=top_companies_value_f.index,
-                    title="Filtered: Market Share by Value",
-                    color_discrete_sequence=colors
+                fig_pie_value_f = share_pie_chart(
+                    tuple(top_companies_value_f.items()),
+                    "Filtered: Market Share by Value",
+                    colors
                 )
-                fig_pie_value_f.update_layout(title_font_color=CUSTOM_COLORS['primary'])
                 st.plotly_chart(fig_pie_value_f, use_container_width=True)
         else:
             st.warning("No data available for the selected value range.")
@@ -582,16 +752,15 @@ def create_market_share_analysis(df):
     
     total_contracts = len(df)
     total_value = df['Summe_Clean'].sum()
-    consulting_df = df[df['Is_Consulting'] == True]
     
     with col1:
         # Top 5 companies concentration
-        top5_contracts = df['Lieferant_Clean'].value_counts().head(5).sum()
+        top5_contracts = top_counts(df['Lieferant_Clean'], 5).sum()
         concentration_contracts = (top5_contracts / total_contracts) * 100
         st.metric("Top 5 Companies", f"{concentration_contracts:.1f}%", "of contracts")
     
     with col2:
-        top5_value = df.groupby('Lieferant_Clean')['Summe_Clean'].sum().sort_values(ascending=False).head(5).sum()
+        top5_value = company_values.head(5).sum()
         concentration_value = (top5_value / total_value) * 100
         st.metric("Top 5 Companies", f"{concentration_value:.1f}%", "of value")
     
@@ -603,7 +772,7 @@ def create_market_share_analysis(df):
         else:
             st.metric("Consulting Share", "0.0%", "of market")
 
-def create_category_analysis(df):
+def create_category_analysis(df, consulting_df):
     """Create category analysis with consulting insights"""
     # Add Horvath & Partners logo to top right
     col1, col2 = st.columns([3, 1])
@@ -626,102 +795,83 @@ def create_category_analysis(df):
     col1, col2 = st.columns(2)
     
     with col1:
-        category_counts = df['CPV_Category'].value_counts().head(top_n)
+        category_counts = top_counts(df['CPV_Category'], top_n)
         colors = get_custom_colors(len(category_counts))
         
-        fig_cat = px.bar(
-            x=category_counts.values,
-            y=category_counts.index,
-            orientation='h',
-            title=f"Top {top_n} Categories by Contract Count",
-            color_discrete_sequence=colors
-        )
-        fig_cat.update_layout(
-            height=500,
-            showlegend=False,
-            title_font_color=CUSTOM_COLORS['primary']
+        fig_cat = top_bar_chart(
+            tuple(category_counts.items()),
+            f"Top {top_n} Categories by Contract Count",
+            colors,
+            height=500
         )
         st.plotly_chart(fig_cat, use_container_width=True)
     
     with col2:
-        category_values = df.groupby('CPV_Category')['Summe_Clean'].sum().sort_values(ascending=False).head(top_n)
+        category_values = df.groupby('CPV_Category', observed=True)['Summe_Clean'].sum().sort_values(ascending=False).head(top_n)
         colors = get_custom_colors(len(category_values))
         
-        fig_cat_val = px.bar(
-            x=category_values.values,
-            y=category_values.index,
-            orientation='h',
-            title=f"Top {top_n} Categories by Value",
-            color_discrete_sequence=colors
-        )
-        fig_cat_val.update_layout(
-            height=500,
-            showlegend=False,
-            title_font_color=CUSTOM_COLORS['primary']
+        fig_cat_val = top_bar_chart(
+            tuple(category_values.items()),
+            f"Top {top_n} Categories by Value",
+            colors,
+            height=500
         )
         st.plotly_chart(fig_cat_val, use_container_width=True)
     
     # Consulting category analysis
-    consulting_df = df[df['Is_Consulting'] == True]
     if not consulting_df.empty:
         st.markdown('<div class="section-header">🎯 Consulting Category Breakdown</div>', unsafe_allow_html=True)
         
         col1, col2 = st.columns(2)
         
         with col1:
-            consulting_categories = consulting_df['CPV_Category'].value_counts().head(8)
+            consulting_categories = top_counts(consulting_df['CPV_Category'], 8)
             colors = get_custom_colors(len(consulting_categories))
             
-            fig_consulting_cat = px.bar(
-                x=consulting_categories.values,
-                y=consulting_categories.index,
-                orientation='h',
-                title="Top Categories for Consulting Firms",
-                color_discrete_sequence=colors
-            )
-            fig_consulting_cat.update_layout(
-                height=400,
-                showlegend=False,
-                title_font_color=CUSTOM_COLORS['primary']
+            fig_consulting_cat = top_bar_chart(
+                tuple(consulting_categories.items()),
+                "Top Categories for Consulting Firms",
+                colors,
+                height=400
             )
             st.plotly_chart(fig_consulting_cat, use_container_width=True)
         
         with col2:
             # Consulting vs non-consulting by top categories
-            top_categories = df['CPV_Category'].value_counts().head(6).index
-            category_comparison = []
-            
-            for cat in top_categories:
-                cat_df = df[df['CPV_Category'] == cat]
-                consulting_count = len(cat_df[cat_df['Is_Consulting'] == True])
-                total_count = len(cat_df)
-                category_comparison.append({
-                    'Category': cat[:30] + '...' if len(cat) > 30 else cat,
-                    'Consulting': consulting_count,
-                    'Non-Consulting': total_count - consulting_count
-                })
+            top_categories = top_counts(df['CPV_Category'], 6).index
             
-            comparison_df = pd.DataFrame(category_comparison)
+            # Count both groups for every category in one crosstab instead of filtering per category
+            category_split = pd.crosstab(df['CPV_Category'], df['Is_Consulting']).reindex(
+                index=top_categories, columns=[True, False], fill_value=0
+            )
             
-            fig_comparison = go.Figure()
-            fig_comparison.add_trace(go.Bar(
-                name='Consulting',
-                x=comparison_df['Category'],
-                y=comparison_df['Consulting'],
-                marker_color=CUSTOM_COLORS['secondary']
-            ))
-            fig_comparison.add_trace(go.Bar(
-                name='Non-Consulting',
-                x=comparison_df['Category'],
-                y=comparison_df['Non-Consulting'],
-                marker_color=CUSTOM_COLORS['gray2']
-            ))
+            comparison_df = pd.DataFrame({
+                'Category': [cat[:30] + '...' if len(cat) > 30 else cat for cat in top_categories],
+                'Consulting': category_split[True].values,
+                'Non-Consulting': category_split[False].values
+            })
             
-            fig_comparison.update_layout(
-                title="Consulting vs Non-Consulting by Category",
-                barmode='stack',
-                height=400,
-                title_font_color=CUSTOM_COLORS['primary']
+            fig_comparison = go.Figure(
+                data=[
+                    go.Bar(
+                        name='Consulting',
+                        x=comparison_df['Category'],
+                        y=comparison_df['Consulting'],
+                        marker_color=CUSTOM_COLORS['secondary']
+                    ),
+                    go.Bar(
+                        name='Non-Consulting',
+                        x=comparison_df['Category'],
+                        y=comparison_df['Non-Consulting'],
+                        marker_color=CUSTOM_COLORS['gray2']
+                    )
+                ],
+                layout=dict(
+                    title="Consulting vs Non-Consulting by Category",
+                    barmode='stack',
+                    height=400,
+                    title_font_color=CUSTOM_COLORS['primary']
+                )
             )
             st.plotly_chart(fig_comparison, use_container_width=True)
     
@@ -729,12 +879,12 @@ def create_category_analysis(df):
     st.markdown('<div class="section-header">🔍 Category Deep Dive</div>', unsafe_allow_html=True)
     selected_category = st.selectbox(
         "Select a category to analyze:",
-        df['CPV_Category'].value_counts().index[:20]
+        top_counts(df['CPV_Category'], 20).index
     )
     
     if selected_category:
         category_df = df[df['CPV_Category'] == selected_category]
-        category_consulting = category_df[category_df['Is_Consulting'] == True]
+        category_consulting = category_df[category_df['Is_Consulting']]
         
         col1, col2, col3, col4 = st.columns(4)
         
@@ -750,7 +900,7 @@ def create_category_analysis(df):
             st.metric("Unique Suppliers", category_df['Lieferant_Clean'].nunique())
         
         # Top performers in category with consulting highlight
-        category_leaders = category_df.groupby('Lieferant_Clean').agg({
+        category_leaders = category_df.groupby('Lieferant_Clean', observed=True).agg({
             'Summe_Clean': ['count', 'sum'],
             'Is_Consulting': 'first'
         }).round(2)
@@ -759,22 +909,15 @@ def create_category_analysis(df):
         
         st.subheader(f"Top Performers in {selected_category}")
         
-        # Style the dataframe to highlight consulting companies
-        def highlight_consulting(val, is_consulting):
-            if is_consulting:
-                return 'background-color: #f95d6a; color: white'
-            return ''
-        
-        # Create a copy for styling without the Is_Consulting column
-        display_df = category_leaders.drop('Is_Consulting', axis=1).copy()
-        
-        # Apply styling based on the original consulting flags
-        styled_df = display_df.style.apply(
-            lambda row: [highlight_consulting(val, category_leaders.loc[row.name, 'Is_Consulting']) 
-                        for val in row], axis=1
+        # Flag consulting companies in a checkbox column instead of styling every cell
+        st.dataframe(
+            category_leaders,
+            use_container_width=True,
+            column_config={
+                'Is_Consulting': st.column_config.CheckboxColumn("Consulting")
+            }
         )
-        st.dataframe(styled_df, use_container_width=True)
-        st.caption("🎯 Consulting companies highlighted in red")
+        st.caption("🎯 Consulting companies are ticked in the Consulting column")
 
 
 
@@ -789,7 +932,7 @@ def create_company_deep_dive(df):
     st.markdown("<br>", unsafe_allow_html=True)
     
     # Company selector
-    companies = sorted(df['Lieferant_Clean'].dropna().unique())
+    companies = supplier_options(df['Lieferant_Clean'])
     selected_company = st.selectbox("Select a company for detailed analysis:", companies)
     
     if not selected_company:
@@ -803,16 +946,20 @@ def create_company_deep_dive(df):
         st.markdown(f'<div class="consulting-highlight">🎯 {selected_company} - CONSULTING FIRM</div>', unsafe_allow_html=True)
         st.write("")
     
+    # Company sums and averages in one agg call, market averages in one mean call
+    company_stats = company_data[['Summe_Clean', 'Bieter']].agg(['sum', 'mean'])
+    market_avgs = df[['Summe_Clean', 'Bieter']].mean()
+    
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
         st.metric("Total Contracts", len(company_data))
     with col2:
-        total_value = company_data['Summe_Clean'].sum()
+        total_value = company_stats.at['sum', 'Summe_Clean']
         st.metric("Total Value", f"€{total_value:,.0f}")
     with col3:
-        avg_value = company_data['Summe_Clean'].mean()
-        market_avg = df['Summe_Clean'].mean()
+        avg_value = company_stats.at['mean', 'Summe_Clean']
+        market_avg = market_avgs['Summe_Clean']
         premium = ((avg_value/market_avg - 1) * 100) if market_avg > 0 else 0
         st.metric("Average Value", f"€{avg_value:,.0f}", f"{premium:+.1f}% vs market")
     with col4:
@@ -822,58 +969,50 @@ def create_company_deep_dive(df):
     col1, col2 = st.columns(2)
     
     with col1:
-        # Company performance over time
-        if not company_data[company_data['Aktualisiert'].notna()].empty:
-            company_time = company_data[company_data['Aktualisiert'].notna()].copy()
-            company_time.loc[:, 'YearMonth'] = company_time['Aktualisiert'].dt.to_period('M')
-            monthly_performance = company_time.groupby('YearMonth').agg({
-                'Summe_Clean': ['count', 'sum']
-            })
-            monthly_performance.columns = ['Contracts', 'Value']
-            
-            fig_performance = make_subplots(specs=[[{"secondary_y": True}]])
-            fig_performance.add_trace(
-                go.Scatter(
-                    x=monthly_performance.index.astype(str), 
-                    y=monthly_performance['Contracts'], 
-                    name="Contracts",
-                    line=dict(color=CUSTOM_COLORS['primary'])
-                ),
-                secondary_y=False,
-            )
-            fig_performance.add_trace(
-                go.Scatter(
-                    x=monthly_performance.index.astype(str), 
-                    y=monthly_performance['Value'], 
-                    name="Value",
-                    line=dict(color=CUSTOM_COLORS['secondary'])
-                ),
-                secondary_y=True,
-            )
-            fig_performance.update_yaxes(title_text="Number of Contracts", secondary_y=False)
-            fig_performance.update_yaxes(title_text="Contract Value (€)", secondary_y=True)
-            fig_performance.update_layout(
-                title=f"{selected_company} - Performance Over Time",
-                title_font_color=CUSTOM_COLORS['primary']
+        # Company performance over time, rows without a valid date fall out of the YearMonth groupby
+        monthly_performance = company_data.groupby('YearMonth').agg({
+            'Summe_Clean': ['count', 'sum']
+        })
+        monthly_performance.columns = ['Contracts', 'Value']
+        
+        if not monthly_performance.empty:
+            # Built in one go, value on a secondary axis overlaying the contract count
+            months = monthly_performance.index.astype(str)
+            fig_performance = go.Figure(
+                data=[
+                    go.Scatter(
+                        x=months, 
+                        y=monthly_performance['Contracts'], 
+                        name="Contracts",
+                        line=dict(color=CUSTOM_COLORS['primary'])
+                    ),
+                    go.Scatter(
+                        x=months, 
+                        y=monthly_performance['Value'], 
+                        name="Value",
+                        line=dict(color=CUSTOM_COLORS['secondary']),
+                        yaxis='y2'
+                    )
+                ],
+                layout=dict(
+                    title=f"{selected_company} - Performance Over Time",
+                    title_font_color=CUSTOM_COLORS['primary'],
+                    yaxis=dict(title_text="Number of Contracts"),
+                    yaxis2=dict(title_text="Contract Value (€)", overlaying='y', side='right')
+                )
             )
             
             st.plotly_chart(fig_performance, use_container_width=True)
     
     with col2:
         # Company's categories
-        company_categories = company_data['CPV_Category'].value_counts().head(8)
+        company_categories = top_counts(company_data['CPV_Category'], 8)
         colors = get_custom_colors(len(company_categories))
         
-        fig_cat = px.bar(
-            x=company_categories.values,
-            y=company_categories.index,
-            orientation='h',
-            title=f"{selected_company} - Top Categories",
-            color_discrete_sequence=colors
-        )
-        fig_cat.update_layout(
-            showlegend=False,
-            title_font_color=CUSTOM_COLORS['primary']
+        fig_cat = top_bar_chart(
+            tuple(company_categories.items()),
+            f"{selected_company} - Top Categories",
+            colors
         )
         st.plotly_chart(fig_cat, use_container_width=True)
     
@@ -882,14 +1021,14 @@ def create_company_deep_dive(df):
     col1, col2 = st.columns(2)
     
     with col1:
-        avg_competition = company_data['Bieter'].mean()
-        market_avg_competition = df['Bieter'].mean()
+        avg_competition = company_stats.at['mean', 'Bieter']
+        market_avg_competition = market_avgs['Bieter']
         st.metric("Avg Competition Faced", f"{avg_competition:.1f}", 
                  f"{avg_competition - market_avg_competition:+.1f} vs market")
     
     with col2:
         # Win rate approximation (assuming they won all contracts they appear in)
-        total_bids_estimated = company_data['Bieter'].sum()  # Rough estimate
+        total_bids_estimated = company_stats.at['sum', 'Bieter']  # Rough estimate
         win_rate = (len(company_data) / total_bids_estimated) * 100 if total_bids_estimated > 0 else 0
         st.metric("Estimated Win Rate", f"{win_rate:.1f}%")
     
@@ -900,49 +1039,27 @@ def create_company_deep_dive(df):
     ]
     st.dataframe(recent_contracts, use_container_width=True)
 
-def create_consulting_competitive_analysis(df):
-    """Create consulting-specific competitive analysis"""
-    # Add Horvath & Partners logo to top right
-    col1, col2 = st.columns([3, 1])
-    with col2:
-        safe_display_image("horvath-partners.jpg", width=400)
-    
-    st.markdown('<div class="main-header">🎯 Consulting Competitive Landscape</div>', unsafe_allow_html=True)
-    st.markdown("<br>", unsafe_allow_html=True)
-    
-    consulting_df = df[df['Is_Consulting'] == True]
-    
-    if consulting_df.empty:
-        st.warning("No consulting companies found in the data.")
-        return
-    
+def positioning_scores(summary):
+    """Value and competition scores on a 0-100 scale, both columns in one numpy pass"""
+    averages = summary[['Avg Value (€)', 'Avg Competition']].to_numpy(dtype='float64')
+    scores = averages * (100.0 / np.nanmax(averages, axis=0))
+    scores[:, 1] = 100.0 - scores[:, 1]
+    return scores
+
+def render_consulting_panels(consulting_summary, title_prefix=""):
+    """Render the value bars and positioning scatter for a consulting firm summary"""
     col1, col2 = st.columns(2)
     
     with col1:
-        # Contract value distribution for consulting firms
-        consulting_summary = consulting_df.groupby('Lieferant_Clean').agg({
-            'Summe_Clean': ['count', 'sum', 'mean'],
-            'Bieter': 'mean'
-        }).round(2)
-        
-        consulting_summary.columns = ['Contracts', 'Total Value (€)', 'Avg Value (€)', 'Avg Competition']
-        consulting_summary = consulting_summary.sort_values('Total Value (€)', ascending=False)
-        
         # Value by company chart
         top_consulting_value = consulting_summary.head(10)['Total Value (€)']
         colors = get_custom_colors(len(top_consulting_value))
         
-        fig_value = px.bar(
-            x=top_consulting_value.values,
-            y=top_consulting_value.index,
-            orientation='h',
-            title="Total Contract Value by Consulting Firm",
-            color_discrete_sequence=colors
-        )
-        fig_value.update_layout(
-            showlegend=False,
-            height=500,
-            title_font_color=CUSTOM_COLORS['primary']
+        fig_value = top_bar_chart(
+            tuple(top_consulting_value.items()),
+            f"{title_prefix}Total Contract Value by Consulting Firm",
+            colors,
+            height=500
         )
         st.plotly_chart(fig_value, use_container_width=True)
     
@@ -952,11 +1069,7 @@ def create_consulting_competitive_analysis(df):
         consulting_summary_viz = consulting_summary.reset_index()
         
         # Normalize values for better comparison (0-100 scale)
-        max_value = consulting_summary_viz['Avg Value (€)'].max()
-        max_competition = consulting_summary_viz['Avg Competition'].max()
-        
-        consulting_summary_viz['Value Score'] = (consulting_summary_viz['Avg Value (€)'] / max_value) * 100
-        consulting_summary_viz['Competition Score'] = 100 - ((consulting_summary_viz['Avg Competition'] / max_competition) * 100)
+        consulting_summary_viz[['Value Score', 'Competition Score']] = positioning_scores(consulting_summary_viz)
         
         # Create quadrant analysis chart
         fig_position = px.scatter(
@@ -972,7 +1085,7 @@ def create_consulting_competitive_analysis(df):
                 'Competition Score': False,
                 'Value Score': False
             },
-            title="Market Positioning Analysis",
+            title=f"{title_prefix}Market Positioning Analysis",
             color='Total Value (€)',
             color_continuous_scale=['lightcoral', 'gold', 'lightgreen'],
             labels={
@@ -986,14 +1099,8 @@ def create_consulting_competitive_analysis(df):
         fig_position.add_vline(x=50, line_dash="dash", line_color="gray", opacity=0.5)
         
         # Add quadrant labels
-        fig_position.add_annotation(x=25, y=75, text="High Value<br>High Competition", 
-                                   showarrow=False, font=dict(size=10, color="gray"))
-        fig_position.add_annotation(x=75, y=75, text="Sweet Spot<br>High Value, Low Competition", 
-                                   showarrow=False, font=dict(size=10, color="darkgreen"))
-        fig_position.add_annotation(x=25, y=25, text="Challenging<br>Low Value, High Competition", 
-                                   showarrow=False, font=dict(size=10, color="darkred"))
-        fig_position.add_annotation(x=75, y=25, text="Low Value<br>Low Competition", 
-                                   showarrow=False, font=dict(size=10, color="gray"))
+        for x, y, text, color in POSITIONING_QUADRANTS:
+            fig_position.add_annotation(x=x, y=y, text=text, showarrow=False, font=dict(size=10, color=color))
         
         fig_position.update_layout(
             height=500,
@@ -1002,42 +1109,36 @@ def create_consulting_competitive_analysis(df):
             yaxis=dict(range=[0, 100])
         )
         st.plotly_chart(fig_position, use_container_width=True)
+
+def create_consulting_competitive_analysis(consulting_df):
+    """Create consulting-specific competitive analysis"""
+    # Add Horvath & Partners logo to top right
+    col1, col2 = st.columns([3, 1])
+    with col2:
+        safe_display_image("horvath-partners.jpg", width=400)
+    
+    st.markdown('<div class="main-header">🎯 Consulting Competitive Landscape</div>', unsafe_allow_html=True)
+    st.markdown("<br>", unsafe_allow_html=True)
+    
+    if consulting_df.empty:
+        st.warning("No consulting companies found in the data.")
+        return
+    
+    # Contract value distribution for consulting firms
+    consulting_summary = consulting_firm_summary(consulting_df)
+    render_consulting_panels(consulting_summary)
     
     # Contract value filter for consulting analysis
     st.subheader("🔧 Filter by Contract Value")
     
-    # Preset value range options
-    col1, col2, col3, col4, col5 = st.columns(5)
-    
-    with col1:
-        if st.button("All Contracts", key="consulting_all", type="secondary"):
-            st.session_state.consulting_filter = "all"
-    with col2:
-        if st.button("Small (€0-50K)", key="consulting_small", type="secondary"):
-            st.session_state.consulting_filter = "small"
-    with col3:
-        if st.button("Medium (€50K-500K)", key="consulting_medium", type="secondary"):
-            st.session_state.consulting_filter = "medium"
-    with col4:
-        if st.button("Large (€500K-2M)", key="consulting_large", type="secondary"):
-            st.session_state.consulting_filter = "large"
-    with col5:
-        if st.button("XL (€2M+)", key="consulting_xl", type="secondary"):
-            st.session_state.consulting_filter = "xl"
-    
-    # Initialize filter if not set
-    if 'consulting_filter' not in st.session_state:
-        st.session_state.consulting_filter = "all"
-    
-    # Show current selection
-    filter_labels = {
-        "all": "All Contracts",
-        "small": "Small (€0-50K)", 
-        "medium": "Medium (€50K-500K)",
-        "large": "Large (€500K-2M)",
-        "xl": "XL (€2M+)"
-    }
-    st.info(f"**Current filter:** {filter_labels[st.session_state.consulting_filter]}")
+    # Preset value range options, the radio keeps the selection in session state
+    st.radio(
+        "Contract size",
+        list(VALUE_FILTER_LABELS),
+        format_func=VALUE_FILTER_LABELS.get,
+        horizontal=True,
+        key="consulting_filter"
+    )
     
     # Apply filter based on selection and add adaptive slider
     if st.session_state.consulting_filter == "small":
@@ -1090,94 +1191,14 @@ def create_consulting_competitive_analysis(df):
     
     # Apply filter and show filtered results if different
     if st.session_state.consulting_filter != "all":
-        consulting_filtered = consulting_df[(consulting_df['Summe_Clean'] >= min_value) & (consulting_df['Summe_Clean'] <= max_value)]
+        consulting_filtered = value_range_rows(consulting_df, st.session_state.consulting_filter, (min_value, max_value), (range_min, range_max))
         if not consulting_filtered.empty:
             st.info(f"Showing results for {len(consulting_filtered):,} consulting contracts (filtered from {len(consulting_df):,})")
             
             # Recalculate summary for filtered data
-            consulting_summary_filtered = consulting_filtered.groupby('Lieferant_Clean').agg({
-                'Summe_Clean': ['count', 'sum', 'mean'],
-                'Bieter': 'mean'
-            }).round(2)
+            consulting_summary_filtered = consulting_firm_summary(consulting_filtered)
             
-            consulting_summary_filtered.columns = ['Contracts', 'Total Value (€)', 'Avg Value (€)', 'Avg Competition']
-            consulting_summary_filtered = consulting_summary_filtered.sort_values('Total Value (€)', ascending=False)
-            
-            col1_f, col2_f = st.columns(2)
-            
-            with col1_f:
-                top_consulting_value_f = consulting_summary_filtered.head(10)['Total Value (€)']
-                colors = get_custom_colors(len(top_consulting_value_f))
-                
-                fig_value_f = px.bar(
-                    x=top_consulting_value_f.values,
-                    y=top_consulting_value_f.index,
-                    orientation='h',
-                    title="Filtered: Total Contract Value by Consulting Firm",
-                    color_discrete_sequence=colors
-                )
-                fig_value_f.update_layout(
-                    showlegend=False,
-                    height=500,
-                    title_font_color=CUSTOM_COLORS['primary']
-                )
-                st.plotly_chart(fig_value_f, use_container_width=True)
-            
-            with col2_f:
-                # Market positioning analysis for filtered data - more intuitive visualization
-                consulting_summary_viz_f = consulting_summary_filtered.reset_index()
-                
-                # Normalize values for better comparison (0-100 scale)
-                max_value_f = consulting_summary_viz_f['Avg Value (€)'].max()
-                max_competition_f = consulting_summary_viz_f['Avg Competition'].max()
-                
-                consulting_summary_viz_f['Value Score'] = (consulting_summary_viz_f['Avg Value (€)'] / max_value_f) * 100
-                consulting_summary_viz_f['Competition Score'] = 100 - ((consulting_summary_viz_f['Avg Competition'] / max_competition_f) * 100)
-                
-                # Create quadrant analysis chart
-                fig_position_f = px.scatter(
-                    consulting_summary_viz_f,
-                    x='Competition Score',
-                    y='Value Score', 
-                    size='Contracts',
-                    hover_name='Lieferant_Clean',
-                    hover_data={
-                        'Avg Value (€)': ':,.0f',
-                        'Avg Competition': ':.1f',
-                        'Contracts': True,
-                        'Competition Score': False,
-                        'Value Score': False
-                    },
-                    title="Filtered: Market Positioning Analysis",
-                    color='Total Value (€)',
-                    color_continuous_scale=['lightcoral', 'gold', 'lightgreen'],
-                    labels={
-                        'Competition Score': 'Lower Competition →',
-                        'Value Score': 'Higher Contract Value →'
-                    }
-                )
-                
-                # Add quadrant lines
-                fig_position_f.add_hline(y=50, line_dash="dash", line_color="gray", opacity=0.5)
-                fig_position_f.add_vline(x=50, line_dash="dash", line_color="gray", opacity=0.5)
-                
-                # Add quadrant labels
-                fig_position_f.add_annotation(x=25, y=75, text="High Value<br>High Competition", 
-                                           showarrow=False, font=dict(size=10, color="gray"))
-                fig_position_f.add_annotation(x=75, y=75, text="Sweet Spot<br>High Value, Low Competition", 
-                                           showarrow=False, font=dict(size=10, color="darkgreen"))
-                fig_position_f.add_annotation(x=25, y=25, text="Challenging<br>Low Value, High Competition", 
-                                           showarrow=False, font=dict(size=10, color="darkred"))
-                fig_position_f.add_annotation(x=75, y=25, text="Low Value<br>Low Competition", 
-                                           showarrow=False, font=dict(size=10, color="gray"))
-                
-                fig_position_f.update_layout(
-                    height=500,
-                    title_font_color=CUSTOM_COLORS['primary'],
-                    xaxis=dict(range=[0, 100]),
-                    yaxis=dict(range=[0, 100])
-                )
-                st.plotly_chart(fig_position_f, use_container_width=True)
+            render_consulting_panels(consulting_summary_filtered, "Filtered: ")
             
             st.subheader("📋 Filtered Consulting Firm Performance")
             st.dataframe(consulting_summary_filtered, use_container_width=True)
@@ -1188,7 +1209,7 @@ def create_consulting_competitive_analysis(df):
         st.subheader("📋 Consulting Firm Performance")
         st.dataframe(consulting_summary, use_container_width=True)
 
-def create_consulting_categories(df):
+def create_consulting_categories(consulting_df):
     """Create consulting category analysis"""
     # Add Horvath & Partners logo to top right
     col1, col2 = st.columns([3, 1])
@@ -1198,49 +1219,35 @@ def create_consulting_categories(df):
     st.markdown('<div class="main-header">📊 Consulting Service Categories</div>', unsafe_allow_html=True)
     st.markdown("<br>", unsafe_allow_html=True)
     
-    consulting_df = df[df['Is_Consulting'] == True]
-    
     if consulting_df.empty:
         st.warning("No consulting companies found in the data.")
         return
     
     # Top categories for consulting
-    consulting_categories = consulting_df['CPV_Category'].value_counts().head(10)
+    consulting_categories = top_counts(consulting_df['CPV_Category'], 10)
     
     col1, col2 = st.columns(2)
     
     with col1:
         colors = get_custom_colors(len(consulting_categories))
-        fig_cat = px.bar(
-            x=consulting_categories.values,
-            y=consulting_categories.index,
-            orientation='h',
-            title="Top Service Categories for Consulting",
-            color_discrete_sequence=colors
-        )
-        fig_cat.update_layout(
-            showlegend=False,
-            height=500,
-            title_font_color=CUSTOM_COLORS['primary']
+        fig_cat = top_bar_chart(
+            tuple(consulting_categories.items()),
+            "Top Service Categories for Consulting",
+            colors,
+            height=500
         )
         st.plotly_chart(fig_cat, use_container_width=True)
     
     with col2:
         # Category value analysis
-        category_values = consulting_df.groupby('CPV_Category')['Summe_Clean'].sum().sort_values(ascending=False).head(10)
+        category_values = consulting_df.groupby('CPV_Category', observed=True)['Summe_Clean'].sum().sort_values(ascending=False).head(10)
         colors = get_custom_colors(len(category_values))
         
-        fig_cat_val = px.bar(
-            x=category_values.values,
-            y=category_values.index,
-            orientation='h',
-            title="Highest Value Categories for Consulting",
-            color_discrete_sequence=colors
-        )
-        fig_cat_val.update_layout(
-            showlegend=False,
-            height=500,
-            title_font_color=CUSTOM_COLORS['primary']
+        fig_cat_val = top_bar_chart(
+            tuple(category_values.items()),
+            "Highest Value Categories for Consulting",
+            colors,
+            height=500
         )
         st.plotly_chart(fig_cat_val, use_container_width=True)
 
@@ -1254,16 +1261,16 @@ def create_timeline_analysis(df):
     st.markdown('<div class="main-header">📅 Market Timeline Analysis</div>', unsafe_allow_html=True)
     st.markdown("<br>", unsafe_allow_html=True)
     
-    # Filter out invalid dates
-    df_time = df[df['Aktualisiert'].notna()].copy()
+    # Invalid dates are skipped by min/max and drop out of the monthly grouping, no filtered copy needed
+    min_timestamp = df['Aktualisiert'].min()
     
-    if df_time.empty:
+    if pd.isna(min_timestamp):
         st.warning("No valid date data available for timeline analysis.")
         return
     
     # Date range selector
-    min_date = df_time['Aktualisiert'].min().date()
-    max_date = df_time['Aktualisiert'].max().date()
+    min_date = min_timestamp.date()
+    max_date = df['Aktualisiert'].max().date()
     
     col1, col2 = st.columns(2)
     with col1:
@@ -1271,78 +1278,133 @@ def create_timeline_analysis(df):
     with col2:
         end_date = st.date_input("End Date", max_date)
     
-    # Filter by date range
-    mask = (df_time['Aktualisiert'].dt.date >= start_date) & (df_time['Aktualisiert'].dt.date <= end_date)
-    df_filtered = df_time[mask]
+    # Monthly trends with consulting overlay for the selected date range
+    monthly_combined = monthly_trends(df, start_date, end_date)
     
-    if df_filtered.empty:
+    if monthly_combined.empty:
         st.warning("No data available for the selected date range.")
         return
     
-    # Monthly trends with consulting overlay
-    df_filtered.loc[:, 'YearMonth'] = df_filtered['Aktualisiert'].dt.to_period('M')
-    
-    # Overall monthly trends
-    monthly_all = df_filtered.groupby('YearMonth').agg({
-        'Summe_Clean': ['count', 'sum']
-    })
-    monthly_all.columns = ['Total_Contracts', 'Total_Value']
-    
-    # Consulting monthly trends
-    consulting_monthly = df_filtered[df_filtered['Is_Consulting'] == True].groupby('YearMonth').agg({
-        'Summe_Clean': ['count', 'sum']
-    })
-    consulting_monthly.columns = ['Consulting_Contracts', 'Consulting_Value']
-    
-    # Combine data
-    monthly_combined = monthly_all.join(consulting_monthly, how='left').fillna(0)
+    months = monthly_combined.index.astype(str)
     
     col1, col2 = st.columns(2)
     
     with col1:
         # Contract count trends
-        fig_contracts = go.Figure()
-        fig_contracts.add_trace(go.Scatter(
-            x=monthly_combined.index.astype(str),
-            y=monthly_combined['Total_Contracts'],
-            name='Total Market',
-            line=dict(color=CUSTOM_COLORS['primary'], width=3)
-        ))
-        fig_contracts.add_trace(go.Scatter(
-            x=monthly_combined.index.astype(str),
-            y=monthly_combined['Consulting_Contracts'],
-            name='Consulting',
-            line=dict(color=CUSTOM_COLORS['secondary'], width=2)
-        ))
-        fig_contracts.update_layout(
-            title="Monthly Contract Trends",
-            title_font_color=CUSTOM_COLORS['primary'],
-            height=400
+        fig_contracts = go.Figure(
+            data=[
+                go.Scatter(
+                    x=months,
+                    y=monthly_combined['Total_Contracts'],
+                    name='Total Market',
+                    line=dict(color=CUSTOM_COLORS['primary'], width=3)
+                ),
+                go.Scatter(
+                    x=months,
+                    y=monthly_combined['Consulting_Contracts'],
+                    name='Consulting',
+                    line=dict(color=CUSTOM_COLORS['secondary'], width=2)
+                )
+            ],
+            layout=dict(
+                title="Monthly Contract Trends",
+                title_font_color=CUSTOM_COLORS['primary'],
+                height=400
+            )
         )
         st.plotly_chart(fig_contracts, use_container_width=True)
     
     with col2:
         # Value trends
-        fig_values = go.Figure()
-        fig_values.add_trace(go.Scatter(
-            x=monthly_combined.index.astype(str),
-            y=monthly_combined['Total_Value'],
-            name='Total Market',
-            line=dict(color=CUSTOM_COLORS['primary'], width=3)
-        ))
-        fig_values.add_trace(go.Scatter(
-            x=monthly_combined.index.astype(str),
-            y=monthly_combined['Consulting_Value'],
-            name='Consulting',
-            line=dict(color=CUSTOM_COLORS['secondary'], width=2)
-        ))
-        fig_values.update_layout(
-            title="Monthly Value Trends",
-            title_font_color=CUSTOM_COLORS['primary'],
-            height=400
+        fig_values = go.Figure(
+            data=[
+                go.Scatter(
+                    x=months,
+                    y=monthly_combined['Total_Value'],
+                    name='Total Market',
+                    line=dict(color=CUSTOM_COLORS['primary'], width=3)
+                ),
+                go.Scatter(
+                    x=months,
+                    y=monthly_combined['Consulting_Value'],
+                    name='Consulting',
+                    line=dict(color=CUSTOM_COLORS['secondary'], width=2)
+                )
+            ],
+            layout=dict(
+                title="Monthly Value Trends",
+                title_font_color=CUSTOM_COLORS['primary'],
+                height=400
+            )
         )
         st.plotly_chart(fig_values, use_container_width=True)
 
+@st.cache_data(show_spinner=False)
+def csv_bytes(df):
+    """UTF-8 encoded CSV of a frame for the download buttons"""
+    # Written straight into a byte buffer, so the whole file never exists as a str as well
+    buffer = io.BytesIO()
+    df.to_csv(buffer, index=False, encoding='utf-8', lineterminator='\n')
+    return buffer.getvalue()
+
+@st.fragment
+def download_section(download_df, company_filter, consulting_df):
+    """Sidebar download buttons, the CSV files are only encoded once the user asks for them"""
+    with st.expander("💾 Download Data"):
+        # Toggling reruns just this fragment, the pages aren't rebuilt
+        if not st.toggle("Prepare CSV files", key="download_prepare"):
+            return
+        
+        # One timestamp for both file names
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        
+        # Prepare filtered data based on current company filter
+        if company_filter == "Consulting Only":
+            download_label = "consulting_contracts"
+        elif company_filter == "Non-Consulting Only":
+            download_label = "non_consulting_contracts"
+        else:
+            download_label = "all_contracts"
+        
+        # Convert DataFrame to CSV, cached so reruns don't re-encode the same rows
+        csv_data = csv_bytes(download_df)
+        
+        # Download button
+        st.download_button(
+            label=f"📥 {download_label.replace('_', ' ').title()}",
+            data=csv_data,
+            file_name=f"obb_procurement_{download_label}_{timestamp}.csv",
+            mime="text/csv",
+            help=f"Download {len(download_df):,} contracts as CSV file"
+        )
+        
+        # Also provide option to download consulting companies only
+        if company_filter != "Consulting Only":
+            if not consulting_df.empty:
+                consulting_csv = csv_bytes(consulting_df)
+                st.download_button(
+                    label="📥 Consulting Only",
+                    data=consulting_csv,
+                    file_name=f"obb_procurement_consulting_only_{timestamp}.csv",
+                    mime="text/csv",
+                    help=f"Download {len(consulting_df):,} consulting contracts as CSV file"
+                )
+
+def reset_to_original_data():
+    """Drop the uploaded data and the filter states, then rerun on the original data"""
+    st.session_state.using_uploaded_data = False
+    st.session_state.uploaded_df = None
+    
+    # Clear the known filter and widget states
+    for key in DASHBOARD_STATE_KEYS:
+        st.session_state.pop(key, None)
+    
+    # Clear any streamlit cache
+    st.cache_data.clear()
+    
+    # Force refresh the page
+    st.rerun()
+
 def main():
     """Main dashboard function with balanced market and consulting view"""
     # Load original data
@@ -1392,14 +1454,20 @@ def main():
         index=0
     )
     
+    # Consulting rows, built once and shared by the pages, the downloads and the footer
+    consulting_df = df[df['Is_Consulting']]
+    
     # Apply company type filter
     if company_filter == "Consulting Only":
-        df_base_filtered = df[df['Is_Consulting'] == True]
+        df_base_filtered = consulting_df
     elif company_filter == "Non-Consulting Only":
-        df_base_filtered = df[df['Is_Consulting'] == False]
+        df_base_filtered = df[~df['Is_Consulting']]
     else:
         df_base_filtered = df
     
+    # Consulting subset of the filtered data for the pages
+    consulting_base_df = consulting_df if company_filter != "Non-Consulting Only" else consulting_df.iloc[:0]
+    
     st.sidebar.markdown("---")
     
     # Upload CSV section - compact
@@ -1410,21 +1478,16 @@ def main():
             help="Upload CSV with same format as original data"
         )
     
-    # Handle file upload
-    if uploaded_file is not None:
+    # Handle file upload, only once per uploaded file so the rerun below doesn't loop
+    if uploaded_file is not None and uploaded_file.file_id != st.session_state.get('uploaded_file_id'):
         try:
-            # Read uploaded file
-            uploaded_df = pd.read_csv(uploaded_file)
-            
-            # Validate format
-            validate_csv_format(uploaded_df)
-            
-            # Process the uploaded data
-            processed_df = process_dataframe(uploaded_df)
+            # Read, validate and process the uploaded file, cached on its contents
+            processed_df = load_uploaded_data(uploaded_file.getvalue())
             
             # Store in session state
             st.session_state.uploaded_df = processed_df
             st.session_state.using_uploaded_data = True
+            st.session_state.uploaded_file_id = uploaded_file.file_id
             
             # Success message
             st.sidebar.success(f"✅ Successfully loaded {len(processed_df):,} contracts from uploaded file!")
@@ -1443,24 +1506,7 @@ def main():
     # Reset to original data button
     if st.session_state.using_uploaded_data:
         if st.sidebar.button("🔄 Reset to Original Data", key="reset_data_btn"):
-            # Clear all session state related to uploaded data
-            st.session_state.using_uploaded_data = False
-            st.session_state.uploaded_df = None
-            
-            # Clear any cached data and filter states
-            keys_to_delete = []
-            for key in st.session_state.keys():
-                if key.startswith(('market_', 'consulting_', 'category_')):
-                    keys_to_delete.append(key)
-            
-            for key in keys_to_delete:
-                del st.session_state[key]
-            
-            # Clear any streamlit cache
-            st.cache_data.clear()
-            
-            # Force refresh the page
-            st.rerun()
+            reset_to_original_data()
     
     # Data source indicator with additional controls
     if st.session_state.using_uploaded_data:
@@ -1476,22 +1522,7 @@ def main():
             st.write(f"**Suppliers:** {df['Lieferant_Clean'].nunique():,}")
             
             if st.button("↩️ Switch Back to Original Data", key="reset_data_expanded"):
-                # Clear everything and reset
-                keys_to_delete = []
-                for key in st.session_state.keys():
-                    if key.startswith(('market_', 'consulting_', 'category_')):
-                        keys_to_delete.append(key)
-                
-                for key in keys_to_delete:
-                    del st.session_state[key]
-                
-                st.session_state.using_uploaded_data = False
-                st.session_state.uploaded_df = None
-                
-                # Clear any streamlit cache
-                st.cache_data.clear()
-                
-                st.rerun()
+                reset_to_original_data()
     else:
         st.sidebar.markdown("🟢 **Using original data**")
         
@@ -1505,13 +1536,13 @@ def main():
     
     # Display selected page
     if page == "Market Overview":
-        create_market_overview(df)  # Always use full dataset for overview
+        create_market_overview(df, consulting_df)  # Always use full dataset for overview
     elif page == "Market Share Analysis":
-        create_market_share_analysis(df_base_filtered)
+        create_market_share_analysis(df_base_filtered, consulting_base_df)
     elif page == "Competitive Intelligence":
-        create_consulting_competitive_analysis(df_base_filtered)
+        create_consulting_competitive_analysis(consulting_base_df)
     elif page == "Category Analysis":
-        create_category_analysis(df_base_filtered)
+        create_category_analysis(df_base_filtered, consulting_base_df)
     elif page == "Timeline Analysis":
         create_timeline_analysis(df_base_filtered)
     elif page == "Company Deep Dive":
@@ -1520,47 +1551,13 @@ def main():
     
     # Compact download section at bottom
     st.sidebar.markdown("---")
-    with st.sidebar.expander("💾 Download Data"):
-        # Prepare filtered data based on current company filter
-        if company_filter == "Consulting Only":
-            download_df = df[df['Is_Consulting'] == True]
-            download_label = "consulting_contracts"
-        elif company_filter == "Non-Consulting Only":
-            download_df = df[df['Is_Consulting'] == False]
-            download_label = "non_consulting_contracts"
-        else:
-            download_df = df
-            download_label = "all_contracts"
-        
-        # Convert DataFrame to CSV
-        csv_data = download_df.to_csv(index=False)
-        
-        # Download button
-        st.download_button(
-            label=f"📥 {download_label.replace('_', ' ').title()}",
-            data=csv_data,
-            file_name=f"obb_procurement_{download_label}_{pd.Timestamp.now().strftime('%Y%m%d_%H%M%S')}.csv",
-            mime="text/csv",
-            help=f"Download {len(download_df):,} contracts as CSV file"
-        )
-        
-        # Also provide option to download consulting companies only
-        if company_filter != "Consulting Only":
-            consulting_df = df[df['Is_Consulting'] == True]
-            if not consulting_df.empty:
-                consulting_csv = consulting_df.to_csv(index=False)
-                st.download_button(
-                    label="📥 Consulting Only",
-                    data=consulting_csv,
-                    file_name=f"obb_procurement_consulting_only_{pd.Timestamp.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                    mime="text/csv",
-                    help=f"Download {len(consulting_df):,} consulting contracts as CSV file"
-                )
+    with st.sidebar:
+        download_section(df_base_filtered, company_filter, consulting_df)
     
     # Footer with balanced stats
     st.sidebar.markdown("---")
     st.sidebar.markdown("📊 **Dashboard Statistics**")
-    consulting_count = len(df[df['Is_Consulting'] == True])
+    consulting_count = len(consulting_df)
     total_count = len(df)
     st.sidebar.markdown(f"Total contracts: {total_count:,}")
     st.sidebar.markdown(f"Consulting: {consulting_count:,} ({consulting_count/total_count*100:.1f}%)")
@@ -4,11 +4,17 @@ Web scraper for OffeneVergaben.at - ÖBB Business Competence Center GmbH
 Scrapes all pages of procurement data and exports to Excel
 
 Requirements:
-pip install selenium beautifulsoup4 pandas openpyxl webdriver-manager
+pip install requests selenium lxml openpyxl webdriver-manager
 """
 
+import csv
+import os
+import re
+import threading
 import time
-import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urljoin, urldefrag
+import requests
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -17,18 +23,70 @@ from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from webdriver_manager.chrome import ChromeDriverManager
-from bs4 import BeautifulSoup
+import lxml.html
+from lxml import etree
 import logging
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+REQUEST_TIMEOUT = 15  # Seconds per HTTP page request
+MAX_RETRIES = 5  # Attempts after a rate limit, server error or dropped connection
+BACKOFF_BASE = 1  # Seconds before the first retry, doubled on every further attempt
+BACKOFF_MAX = 30  # Upper bound for a single backoff wait
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+CHROMEDRIVER_PATH = os.environ.get("CHROMEDRIVER_PATH")  # Pinned driver binary, skips webdriver-manager
+PAGE_WORKERS = 3  # Pages fetched in parallel once the page count is known, kept low to stay polite
+ROW_WAIT_TIMEOUT = 2  # Seconds Chrome waits for the first table row, the most the old fixed sleep cost
+USER_AGENT = ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+              "(KHTML, like Gecko) Chrome/126.0 Safari/537.36")
+
+# Requests Chrome drops before they leave the browser, none of them are needed for the table
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.svg", "*.css", "*.woff", "*.woff2",
+    "*google-analytics.com*", "*googletagmanager.com*"
+]
+
+# Common selectors for next buttons, tried in order on the live page and on fetched HTML alike
+NEXT_BUTTON_SELECTORS = [
+    "//a[contains(@class, 'next')]",
+    "//button[contains(@class, 'next')]",
+    "//a[contains(text(), '»')]",
+    "//a[contains(text(), '>')]",
+    "//a[contains(@aria-label, 'next')]",
+    "//a[contains(@aria-label, 'Next')]",
+    "//a[@rel='next']",
+    "//li[contains(@class, 'next')]/a",
+    "//a[contains(@class, 'page-link') and contains(text(), '»')]",
+    # Parenthesised so only the pagination's final link matches, not the last link inside every list item
+    "(//*[contains(@class, 'pagination')]//a)[last()]"
+]
+
+# Page number in pagination links like "?page=12"
+PAGE_PARAM_PATTERN = re.compile(r'[?&]page=(\d+)')
+
+# XPaths for fetched pages, compiled once instead of being re-parsed for every page and row
+NEXT_LINK_XPATHS = {selector: etree.XPath(selector) for selector in NEXT_BUTTON_SELECTORS}
+PAGINATION_HREF_XPATH = etree.XPath('//*[contains(@class, "pagination")]//a/@href')
+TABLE_XPATH = etree.XPath('//table')
+ROW_XPATH = etree.XPath('.//tr')
+CELL_XPATH = etree.XPath('.//td | .//th')
+
 class OffeneVergabenScraper:
     def __init__(self, base_url="https://offenevergaben.at/auftraggeber/8550"):
         self.base_url = base_url
         self.driver = None
-        self.all_data = []
+        self.local = threading.local()  # Per-thread HTTP session for the parallel page fetches
+        self.sessions = []
+        self.sessions_lock = threading.Lock()
+        self.next_selector = None  # Next button selector that matched on an earlier page
+        self.filename = None
+        self.part_filename = None  # Rows stream here and only replace filename once the run finishes
+        self.output_file = None
+        self.writer = None
+        self.row_count = 0
+        self.page_row_count = 0  # <tr> rows in the last extracted table, malformed ones included
         self.headers = []
         
     def setup_driver(self):
@@ -43,10 +101,36 @@ class OffeneVergabenScraper:
         # Run headless for faster scraping
         chrome_options.add_argument("--headless")
         
-        service = Service(ChromeDriverManager().install())
+        # Skip the browser's own background work, none of it is needed to read a table
+        chrome_options.add_argument("--disable-extensions")
+        chrome_options.add_argument("--disable-background-networking")
+        chrome_options.add_argument("--disable-features=Translate,MediaRouter,OptimizationHints")
+        
+        # Only the table HTML is needed, so skip images, stylesheets, fonts, plugins and popups
+        chrome_options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.managed_default_content_settings.stylesheets": 2,
+            "profile.managed_default_content_settings.fonts": 2,
+            "profile.managed_default_content_settings.plugins": 2,
+            "profile.managed_default_content_settings.popups": 2
+        })
+        
+        # Return from driver.get() once the DOM is parsed, wait_for_page_load still waits for the table
+        chrome_options.page_load_strategy = 'eager'
+        
+        # Prefer a pinned chromedriver over webdriver-manager's version lookup and download
+        driver_path = CHROMEDRIVER_PATH
+        if not driver_path or not os.path.isfile(driver_path):
+            driver_path = ChromeDriverManager().install()
+        
+        service = Service(driver_path)
         self.driver = webdriver.Chrome(service=service, options=chrome_options)
         self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
         
+        # Block the remaining asset and tracker requests at the network layer
+        self.driver.execute_cdp_cmd("Network.enable", {})
+        self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+        
         logger.info("Chrome WebDriver initialized successfully")
         
     def wait_for_page_load(self, timeout=10):
@@ -55,84 +139,109 @@ class OffeneVergabenScraper:
             WebDriverWait(self.driver, timeout).until(
                 EC.presence_of_element_located((By.TAG_NAME, "table"))
             )
-            time.sleep(2)  # Additional wait for dynamic content
+            
+            # Dynamic content fills the rows after the table appears, return as soon as the first one is there
+            try:
+                WebDriverWait(self.driver, ROW_WAIT_TIMEOUT).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, "table tbody tr"))
+                )
+            except TimeoutException:
+                logger.info("Table has no rows")
             return True
         except TimeoutException:
-            logger.warning(f"Page load timeout after {timeout} seconds")
+            logger.warning("Page load timeout after %d seconds", timeout)
             return False
     
-    def extract_table_data(self):
-        """Extract data from the current page's table"""
+    @staticmethod
+    def cell_text(cell):
+        """Text of a table cell with each text piece stripped, like BeautifulSoup's get_text(strip=True)"""
+        return ''.join(text.strip() for text in cell.itertext())
+    
+    def extract_table_data(self, tree):
+        """Extract data from the table of a parsed page"""
         try:
-            # Get page source and parse with BeautifulSoup
-            soup = BeautifulSoup(self.driver.page_source, 'html.parser')
-            
             # Find the main data table
-            table = soup.find('table')
-            if not table:
+            tables = TABLE_XPATH(tree)
+            if not tables:
                 logger.error("No table found on the current page")
                 return False
+            table = tables[0]
             
             # Extract headers if not already done
             if not self.headers:
-                header_row = table.find('thead')
-                if header_row:
-                    self.headers = [th.get_text(strip=True) for th in header_row.find_all(['th', 'td'])]
+                header_row = table.find('.//thead')
+                if header_row is not None:
+                    self.headers = [self.cell_text(th) for th in CELL_XPATH(header_row)]
                 else:
                     # If no thead, try to get headers from first row
-                    first_row = table.find('tr')
-                    if first_row:
-                        self.headers = [th.get_text(strip=True) for th in first_row.find_all(['th', 'td'])]
+                    first_row = table.find('.//tr')
+                    if first_row is not None:
+                        self.headers = [self.cell_text(th) for th in CELL_XPATH(first_row)]
                 
-                logger.info(f"Extracted headers: {self.headers}")
+                logger.info("Extracted headers: %s", self.headers)
             
             # Extract data rows
-            tbody = table.find('tbody')
-            if tbody:
-                rows = tbody.find_all('tr')
+            tbody = table.find('.//tbody')
+            if tbody is not None:
+                rows = ROW_XPATH(tbody)
             else:
                 # If no tbody, get all rows except the header
-                rows = table.find_all('tr')[1:] if self.headers else table.find_all('tr')
+                rows = ROW_XPATH(table)[1:] if self.headers else ROW_XPATH(table)
+            self.page_row_count = len(rows)
             
-            page_data = []
-            for row in rows:
-                cells = row.find_all(['td', 'th'])
-                if cells:
-                    row_data = [cell.get_text(strip=True) for cell in cells]
-                    # Only add rows that match the expected number of columns
-                    if len(row_data) == len(self.headers):
-                        page_data.append(row_data)
+            # Only rows that match the expected number of columns, checked on the cells before any text is built
+            n_cols = len(self.headers)
+            page_data = [
+                [self.cell_text(cell) for cell in cells]
+                for cells in map(CELL_XPATH, rows)
+                if cells and len(cells) == n_cols
+            ]
+            
+            if page_data:
+                # Open the file on the first rows so a run without contracts leaves no empty file
+                if self.writer is None:
+                    self.output_file = open(self.part_filename, 'w', newline='', encoding='utf-8')
+                    self.writer = csv.writer(self.output_file, lineterminator='\n')
+                    self.writer.writerow(self.headers)
+                
+                # Stream the page straight to disk instead of holding every row in memory
+                self.writer.writerows(page_data)
+                self.row_count += len(page_data)
             
-            self.all_data.extend(page_data)
-            logger.info(f"Extracted {len(page_data)} rows from current page. Total rows: {len(self.all_data)}")
+            logger.info("Extracted %d rows from current page. Total rows: %d", len(page_data), self.row_count)
             return True
             
         except Exception as e:
-            logger.error(f"Error extracting table data: {str(e)}")
+            logger.error("Error extracting table data: %s", e)
             return False
     
+    def next_button_selectors(self):
+        """Next button selectors to try, the one that matched before first since every page shares the layout"""
+        if self.next_selector:
+            return [self.next_selector] + [selector for selector in NEXT_BUTTON_SELECTORS if selector != self.next_selector]
+        return NEXT_BUTTON_SELECTORS
+    
+    def find_next_url(self, tree, page_url):
+        """Resolve the next page link of a fetched page, None on the last page"""
+        for selector in self.next_button_selectors():
+            for link in NEXT_LINK_XPATHS[selector](tree):
+                href = link.get('href')
+                if href:
+                    self.next_selector = selector
+                    next_url = urldefrag(urljoin(page_url, href))[0]
+                    # A link back to the same page means there is nothing left to follow
+                    return next_url if next_url != urldefrag(page_url)[0] else None
+        return None
+    
     def find_next_button(self):
         """Find and return the next page button"""
         try:
-            # Common selectors for next buttons
-            next_button_selectors = [
-                "//a[contains(@class, 'next')]",
-                "//button[contains(@class, 'next')]",
-                "//a[contains(text(), '»')]",
-                "//a[contains(text(), '>')]",
-                "//a[contains(@aria-label, 'next')]",
-                "//a[contains(@aria-label, 'Next')]",
-                "//a[@rel='next']",
-                "//li[contains(@class, 'next')]/a",
-                "//a[contains(@class, 'page-link') and contains(text(), '»')]",
-                "//*[contains(@class, 'pagination')]//a[last()]"
-            ]
-            
-            for selector in next_button_selectors:
+            for selector in self.next_button_selectors():
                 try:
                     elements = self.driver.find_elements(By.XPATH, selector)
                     for element in elements:
                         if element.is_enabled() and element.is_displayed():
+                            self.next_selector = selector
                             return element
                 except:
                     continue
@@ -140,7 +249,7 @@ class OffeneVergabenScraper:
             return None
             
         except Exception as e:
-            logger.error(f"Error finding next button: {str(e)}")
+            logger.error("Error finding next button: %s", e)
             return None
     
     def click_next_page(self):
@@ -148,108 +257,248 @@ class OffeneVergabenScraper:
         try:
             next_button = self.find_next_button()
             if next_button:
-                # Scroll to the button to ensure it's visible
-                self.driver.execute_script("arguments[0].scrollIntoView();", next_button)
-                time.sleep(1)
+                # A row of the current page (or its table) goes stale once the next page replaces it
+                current_content = (self.driver.find_elements(By.CSS_SELECTOR, "table tbody tr")
+                                   or self.driver.find_elements(By.TAG_NAME, "table"))
                 
-                # Try clicking the button
-                next_button.click()
-                time.sleep(3)  # Wait for page to load
+                # Scroll to the button and click it in one script call instead of two WebDriver round-trips
+                self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'}); arguments[0].click();", next_button)
+                if current_content:
+                    WebDriverWait(self.driver, 10).until(EC.staleness_of(current_content[0]))
+                self.wait_for_page_load()
                 return True
             else:
                 logger.info("No next button found or next button is disabled")
                 return False
                 
         except Exception as e:
-            logger.error(f"Error clicking next page: {str(e)}")
+            logger.error("Error clicking next page: %s", e)
             return False
     
-    def scrape_all_pages(self, max_pages=107):
-        """Main scraping function to go through all pages"""
-        try:
-            self.setup_driver()
+    def get_session(self):
+        """Get the calling thread's HTTP session, creating it on first use"""
+        session = getattr(self.local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            session.headers.update({'User-Agent': USER_AGENT})
+            self.local.session = session
+            with self.sessions_lock:
+                self.sessions.append(session)
+        return session
+    
+    def fetch_page(self, page_url):
+        """GET a page over the calling thread's reused HTTP session, backing off only when the server pushes back"""
+        for attempt in range(MAX_RETRIES + 1):
+            delay = min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt)
+            try:
+                response = self.get_session().get(page_url, timeout=REQUEST_TIMEOUT)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if attempt == MAX_RETRIES:
+                    raise
+                logger.warning("%s for %s, retrying in %ds", type(e).__name__, page_url, delay)
+                time.sleep(delay)
+                continue
             
-            # Navigate to the starting page
-            logger.info(f"Navigating to {self.base_url}")
-            self.driver.get(self.base_url)
+            if response.status_code in RETRY_STATUS_CODES and attempt < MAX_RETRIES:
+                # Honour the server's Retry-After hint when it gives one in seconds
+                retry_after = response.headers.get('Retry-After', '')
+                if retry_after.isdigit():
+                    delay = min(BACKOFF_MAX, int(retry_after))
+                logger.warning("HTTP %d for %s, retrying in %ds", response.status_code, page_url, delay)
+                time.sleep(delay)
+                continue
             
-            if not self.wait_for_page_load():
-                raise Exception("Failed to load initial page")
+            response.raise_for_status()
+            return response.text
+    
+    def find_last_page(self, tree):
+        """Highest page number linked from a page's pagination, None without pagination"""
+        page_numbers = [int(match.group(1)) for match in map(PAGE_PARAM_PATTERN.search, PAGINATION_HREF_XPATH(tree)) if match]
+        return max(page_numbers, default=None)
+    
+    def iter_http_pages(self, page_source, max_pages):
+        """Yield (page number, parsed page) in order, fetching the pages linked from page 1 in parallel"""
+        page_url = self.base_url
+        tree = lxml.html.document_fromstring(page_source)
+        current_page = 1
+        yield current_page, tree
+        
+        # Pages up to the highest one in the pagination have known URLs, so they don't need to wait on each other
+        last_page = min(self.find_last_page(tree) or 1, max_pages)
+        if last_page > 1:
+            page_urls = [f"{self.base_url}?page={number}" for number in range(2, last_page + 1)]
+            executor = ThreadPoolExecutor(max_workers=PAGE_WORKERS)
+            try:
+                futures = [executor.submit(self.fetch_page, page_url) for page_url in page_urls]
+                for page_url, future in zip(page_urls, futures):
+                    current_page += 1
+                    try:
+                        page_source = future.result()
+                    except requests.RequestException as e:
+                        # A page that keeps failing costs its own rows, not the whole run
+                        logger.error("Skipping page %d, it still failed after retries: %s", current_page, e)
+                        tree = None
+                        continue
+                    tree = lxml.html.document_fromstring(page_source)
+                    yield current_page, tree
+            finally:
+                # On a hard failure or an abandoned run, drop the fetches still queued instead of waiting them out
+                executor.shutdown(cancel_futures=True)
+        
+        if tree is None:
+            logger.warning("Last linked page %d was skipped, no next link to follow past it", current_page)
+            return
+        
+        # Past the linked pages (or without a page count) follow the next links one by one
+        while current_page < max_pages:
+            next_url = self.find_next_url(tree, page_url)
+            if not next_url:
+                logger.info("No more pages available. Stopped at page %d", current_page)
+                return
             
-            current_page = 1
+            # Without the page there is no next link to follow, so stop and keep the rows written so far
+            try:
+                page_source = self.fetch_page(next_url)
+            except requests.RequestException as e:
+                logger.error("Page %d still failed after retries, stopped at page %d: %s", current_page + 1, current_page, e)
+                return
             
-            while current_page <= max_pages:
-                logger.info(f"Scraping page {current_page} of {max_pages}")
-                
-                # Extract data from current page
-                if not self.extract_table_data():
-                    logger.warning(f"Failed to extract data from page {current_page}")
-                
-                # Check if we're on the last page or reached max pages
-                if current_page >= max_pages:
-                    break
-                
-                # Try to go to next page
-                if not self.click_next_page():
-                    logger.info(f"No more pages available or failed to navigate. Stopped at page {current_page}")
+            page_url = next_url
+            tree = lxml.html.document_fromstring(page_source)
+            current_page += 1
+            yield current_page, tree
+    
+    def scrape_pages_over_http(self, page_source, max_pages):
+        """Scrape the pages with plain HTTP requests while the table is server-rendered"""
+        current_page = 0
+        
+        for current_page, tree in self.iter_http_pages(page_source, max_pages):
+            logger.info("Scraping page %d of %d", current_page, max_pages)
+            
+            if not self.extract_table_data(tree):
+                logger.warning("Failed to extract data from page %d", current_page)
+        
+        return current_page
+    
+    def browser_table_html(self):
+        """The live page's table, serialized in the browser instead of pulling the whole page_source"""
+        return self.driver.execute_script(
+            "const table = document.querySelector('table'); return table ? table.outerHTML : null;"
+        )
+    
+    def parse_browser_table(self, table_html):
+        """Parse a table pulled from the live page"""
+        # Without a table the full page is parsed, so extract_table_data reports the miss as before
+        return lxml.html.document_fromstring(table_html or self.driver.page_source)
+    
+    def scrape_pages_in_browser(self, max_pages):
+        """Click through the pages in Chrome, for when the table is rendered client-side"""
+        self.setup_driver()
+        self.driver.get(self.base_url)
+        
+        if not self.wait_for_page_load():
+            raise Exception("Failed to load initial page")
+        
+        current_page = 1
+        previous_fingerprint = None
+        page_size = None
+        
+        while current_page <= max_pages:
+            logger.info("Scraping page %d of %d", current_page, max_pages)
+            
+            # A table identical to the previous page means the click didn't advance, don't write its rows twice
+            table_html = self.browser_table_html()
+            fingerprint = hash(table_html)
+            if table_html and fingerprint == previous_fingerprint:
+                logger.warning("Page %d repeats the previous page, stopping", current_page)
+                current_page -= 1
+                break
+            previous_fingerprint = fingerprint
+            
+            # Extract data from current page
+            extracted = self.extract_table_data(self.parse_browser_table(table_html))
+            if not extracted:
+                logger.warning("Failed to extract data from page %d", current_page)
+            
+            # Check if we're on the last page or reached max pages
+            if current_page >= max_pages:
+                break
+            
+            # The first page's table sets the page size, a shorter table is the last page without probing for a
+            # next button. Counted on the raw rows, and a page that failed to extract says nothing about the end
+            if extracted:
+                if page_size is None:
+                    page_size = self.page_row_count
+                elif self.page_row_count < page_size:
+                    logger.info("Page %d has %d of %d rows, reached the last page", current_page, self.page_row_count, page_size)
                     break
-                
-                current_page += 1
-                
-                # Add a small delay between requests to be respectful
-                time.sleep(2)
             
-            logger.info(f"Scraping completed. Total pages scraped: {current_page}")
-            logger.info(f"Total rows extracted: {len(self.all_data)}")
+            # Try to go to next page
+            if not self.click_next_page():
+                logger.info("No more pages available or failed to navigate. Stopped at page %d", current_page)
+                break
             
-        except Exception as e:
-            logger.error(f"Error during scraping: {str(e)}")
-            raise
-        finally:
-            if self.driver:
-                self.driver.quit()
+            current_page += 1
+        
+        return current_page
     
-    def save_to_csv(self, filename="offenevergaben_data.csv"):
-        """Save the scraped data to CSV file"""
+    def scrape_all_pages(self, max_pages=107, filename="offenevergaben_data.csv"):
+        """Main scraping function to go through all pages, writing the rows to a CSV file as they come in"""
+        self.filename = filename
+        self.part_filename = filename + '.part'
+        
         try:
-            if not self.all_data:
-                logger.warning("No data to save")
-                return False
+            # Navigate to the starting page, Chrome is only needed if the table isn't in the plain HTML
+            logger.info("Navigating to %s", self.base_url)
+            page_source = self.fetch_page(self.base_url)
             
-            # Create DataFrame
-            df = pd.DataFrame(self.all_data, columns=self.headers if self.headers else None)
+            if '<table' in page_source:
+                current_page = self.scrape_pages_over_http(page_source, max_pages)
+            else:
+                logger.warning("No table in the server response, falling back to Selenium")
+                current_page = self.scrape_pages_in_browser(max_pages)
             
-            # Save to CSV
-            df.to_csv(filename, index=False, encoding='utf-8')
-            logger.info(f"Data saved to {filename}")
-            logger.info(f"Total rows saved: {len(df)}")
-            logger.info(f"Columns: {list(df.columns)}")
+            logger.info("Scraping completed. Total pages scraped: %d", current_page)
+            logger.info("Total rows extracted: %d", self.row_count)
             
-            return True
+            if self.row_count:
+                # Swap the finished file in, a failed run leaves the previous dataset untouched
+                self.output_file.close()
+                os.replace(self.part_filename, filename)
+                logger.info("Data saved to %s", filename)
+                logger.info("Columns: %s", self.headers)
+            else:
+                logger.warning("No data to save")
             
         except Exception as e:
-            logger.error(f"Error saving to CSV: {str(e)}")
-            return False
+            logger.error("Error during scraping: %s", e)
+            raise
+        finally:
+            if self.output_file:
+                self.output_file.close()
+            if os.path.exists(self.part_filename):
+                os.remove(self.part_filename)
+            for session in self.sessions:
+                session.close()
+            if self.driver:
+                self.driver.quit()
 
 def main():
     """Main function to run the scraper"""
     scraper = OffeneVergabenScraper()
     
     try:
-        # Start scraping
-        scraper.scrape_all_pages(max_pages=107)
-        
-        # Save data to CSV in data directory
-        scraper.save_to_csv("../data/single_subsidiary_data.csv")
+        # Start scraping, rows are saved to the CSV in the data directory as each page is parsed
+        scraper.scrape_all_pages(max_pages=107, filename="../data/single_subsidiary_data.csv")
         
         print("\n" + "="*50)
         print("SCRAPING COMPLETED SUCCESSFULLY!")
-        print(f"Total records extracted: {len(scraper.all_data)}")
+        print(f"Total records extracted: {scraper.row_count}")
         print("Data saved to: ../data/single_subsidiary_data.csv")
         print("="*50)
         
     except Exception as e:
-        logger.error(f"Scraping failed: {str(e)}")
+        logger.error("Scraping failed: %s", e)
         print(f"\nError: {str(e)}")
 
 if __name__ == "__main__":